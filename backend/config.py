@@ -1,11 +1,38 @@
 """Configuration settings for the federated learning demo."""
 
+import os
+
 # Federated Learning Settings
 NUM_CLIENTS = 3
 NUM_ROUNDS = 5
 LOCAL_EPOCHS = 2
 BATCH_SIZE = 32
 LEARNING_RATE = 0.001
+KEEP_OPTIMIZER_STATE = True  # Carry client optimizer moments across rounds (pipelined runs only)
+CLIENT_POOL_SIZE = 16  # Clients kept alive per simulation worker
+
+# Aggregation Settings
+AGGREGATION_RULE = "fedavg"  # "fedavg", "median", "trimmed_mean" or "clipped_fedavg"
+TRIM_RATIO = 0.1  # Fraction of clients dropped at each end per coordinate (trimmed_mean)
+CLIP_NORM = 5.0  # Max L2 norm of a client's update (clipped_fedavg)
+
+# Federated Strategy Settings
+FEDERATED_STRATEGY = "fedavg"  # "fedavg", "fedavgm", "fedadam", "fedyogi" or "fedprox"
+SERVER_LEARNING_RATE = None  # Server step size (None: per-optimizer default)
+SERVER_MOMENTUM = 0.9  # Server momentum / first moment decay
+SERVER_BETA2 = 0.99  # Second moment decay (fedadam, fedyogi)
+SERVER_ADAPTIVITY = 1e-3  # Adaptivity constant tau (fedadam, fedyogi)
+PROXIMAL_MU = 0.01  # Client proximal term weight (fedprox)
+
+# Continual Learning Settings
+CONTINUAL_ROUNDS = 2  # Extra rounds run on newly arrived batches
+CONTINUAL_BATCH_SIZE = 50  # New patients per hospital per batch
+
+# Round Scheduling
+PIPELINED_ROUNDS = False  # Overlap round r's evaluation with round r+1's local fit (in-process)
+
+# Resource Settings
+SERVING_RESERVED_CPUS = 1  # Cores kept free for the API when training runs in-process
 
 # Client Names (Hospitals)
 CLIENT_NAMES = [
@@ -23,8 +50,31 @@ TEST_SIZE = 0.2
 HIDDEN_LAYERS = [64, 32, 16]
 DROPOUT_RATE = 0.3
 
+# Personalization Settings
+PERSONALIZATION_EPOCHS = 20  # Local epochs fine-tuning each hospital's output head
+PERSONALIZATION_LR = 0.01
+PERSONALIZED_CACHE_SIZE = 32  # Hospital head deltas kept in memory per replica
+
+# Precision Settings
+TRAINING_PRECISION = "fp32"  # "fp32" or "bf16" (CPU autocast during local training)
+SERVING_PRECISION = "fp32"  # "fp32" or "int8" (dynamic quantization for CPU serving)
+PRECISION_PARITY_TOLERANCE = 0.02  # Max accuracy drop allowed versus fp32
+
 # SHAP Settings
 SHAP_BACKGROUND_SAMPLES = 100
+EXPLAINER_BACKEND = "native"  # "native" (built-in DeepLIFT) or "shap" (shap.DeepExplainer)
+ATTRIBUTION_BACKGROUND_CLUSTERS = None  # Opt-in k-means summary of the background (e.g. 10); approximate, see summarize_background
+
+# Global Explanation Settings
+GLOBAL_IMPORTANCE_COHORT_SIZE = 3000  # Pooled evaluation patients across hospitals
+GLOBAL_IMPORTANCE_CHUNK_SIZE = 250  # Patients attributed per worker task
+GLOBAL_IMPORTANCE_WORKERS = 2
+
+# Artifact Storage
+ARTIFACTS_DIR = os.environ.get(  # Models, checkpoints and caches; override with the ARTIFACTS_DIR env var
+    "ARTIFACTS_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "artifacts")
+)
+CHECKPOINTS_TO_KEEP = 2  # Round checkpoints retained for crash recovery
 
 # Feature Names for Heart Disease Dataset
 FEATURE_NAMES = [
@@ -6,5 +6,8 @@ class HospitalController:
     
     def get_clients(self):
         return self.service.get_clients()
+    
+    def predict(self, hospital_id: int, features: dict):
+        return self.service.predict(hospital_id, features)
 
 hospital_controller = HospitalController()
\ No newline at end of file
@@ -7,6 +7,12 @@ class PredictionController:
     def predict(self, features: dict):
         return self.service.predict(features)
     
+    def predict_batch(self, records: list):
+        return self.service.predict_batch(records)
+    
+    def explain_global(self):
+        return self.service.explain_global()
+    
     def get_features(self):
         return self.service.get_features()
 
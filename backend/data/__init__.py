@@ -1,5 +1,14 @@
 """Data package."""
 
-from .dataset import generate_heart_disease_data, generate_new_batch
+from .dataset import generate_heart_disease_data, generate_new_batch, FEATURE_RANGES
+from .encoder import FeatureEncoder, InvalidFeaturesError, compute_feature_statistics, aggregate_feature_statistics
 
-__all__ = ['generate_heart_disease_data', 'generate_new_batch']
+__all__ = [
+    'generate_heart_disease_data',
+    'generate_new_batch',
+    'FEATURE_RANGES',
+    'FeatureEncoder',
+    'InvalidFeaturesError',
+    'compute_feature_statistics',
+    'aggregate_feature_statistics'
+]
@@ -4,8 +4,26 @@ import numpy as np
 from sklearn.model_selection import train_test_split
 from config import NUM_FEATURES, SAMPLES_PER_CLIENT, TEST_SIZE
 
+# Raw value ranges of the generated features, in FEATURE_NAMES order:
+# (kind, low, high) with "int" ranges excluding high
+FEATURE_RANGES = [
+    ("int", 30, 80),      # Age
+    ("int", 0, 2),        # Sex
+    ("int", 0, 4),        # Chest pain type
+    ("int", 90, 200),     # Resting BP
+    ("int", 120, 400),    # Cholesterol
+    ("int", 0, 2),        # Fasting blood sugar
+    ("int", 0, 3),        # Resting ECG
+    ("int", 70, 200),     # Max heart rate
+    ("int", 0, 2),        # Exercise angina
+    ("float", 0.0, 6.0),  # Oldpeak (with decimals)
+    ("int", 0, 3),        # ST slope
+    ("int", 0, 4),        # CA
+    ("int", 0, 3),        # Thal
+]
 
-def generate_heart_disease_data(num_samples=200, client_id=0, seed=None):
+
+def generate_heart_disease_data(num_samples=200, client_id=0, seed=None, normalization=None, normalize=True):
     """
     Generate synthetic heart disease dataset.
     
@@ -13,6 +31,9 @@ def generate_heart_disease_data(num_samples=200, client_id=0, seed=None):
         num_samples: Number of samples to generate
         client_id: Client identifier for reproducibility
         seed: Random seed (if None, uses client_id)
+        normalization: Global {"mean", "std"} statistics to normalize with;
+            if None, the data is normalized with its own statistics
+        normalize: If False, return raw clinical values
     
     Returns:
         X_train, X_test, y_train, y_test: Train/test splits
@@ -20,49 +41,17 @@ def generate_heart_disease_data(num_samples=200, client_id=0, seed=None):
     if seed is None:
         seed = 42 + client_id
     
-    np.random.seed(seed)
+    # Local generator: several threads generate data concurrently, and
+    # reseeding numpy's global RNG would interleave their draws
+    rng = np.random.default_rng(seed)
     
     # Generate features
     X = np.zeros((num_samples, NUM_FEATURES))
-    
-    # Age: 30-80
-    X[:, 0] = np.random.randint(30, 80, num_samples)
-    
-    # Sex: 0 or 1
-    X[:, 1] = np.random.randint(0, 2, num_samples)
-    
-    # Chest pain type: 0-3
-    X[:, 2] = np.random.randint(0, 4, num_samples)
-    
-    # Resting BP: 90-200
-    X[:, 3] = np.random.randint(90, 200, num_samples)
-    
-    # Cholesterol: 120-400
-    X[:, 4] = np.random.randint(120, 400, num_samples)
-    
-    # Fasting blood sugar: 0 or 1
-    X[:, 5] = np.random.randint(0, 2, num_samples)
-    
-    # Resting ECG: 0-2
-    X[:, 6] = np.random.randint(0, 3, num_samples)
-    
-    # Max heart rate: 70-200
-    X[:, 7] = np.random.randint(70, 200, num_samples)
-    
-    # Exercise angina: 0 or 1
-    X[:, 8] = np.random.randint(0, 2, num_samples)
-    
-    # Oldpeak: 0-6 (with decimals)
-    X[:, 9] = np.random.uniform(0, 6, num_samples)
-    
-    # ST slope: 0-2
-    X[:, 10] = np.random.randint(0, 3, num_samples)
-    
-    # CA: 0-3
-    X[:, 11] = np.random.randint(0, 4, num_samples)
-    
-    # Thal: 0-2
-    X[:, 12] = np.random.randint(0, 3, num_samples)
+    for i, (kind, low, high) in enumerate(FEATURE_RANGES):
+        if kind == "int":
+            X[:, i] = rng.integers(low, high, num_samples)
+        else:
+            X[:, i] = rng.uniform(low, high, num_samples)
     
     # Generate labels based on risk factors (synthetic logic)
     risk_score = (
@@ -77,13 +66,17 @@ def generate_heart_disease_data(num_samples=200, client_id=0, seed=None):
     
     # Add some randomness and client-specific bias
     client_bias = (client_id * 0.05) - 0.05  # -0.05, 0, 0.05 for 3 clients
-    risk_score += client_bias + np.random.normal(0, 0.1, num_samples)
+    risk_score += client_bias + rng.normal(0, 0.1, num_samples)
     
     # Convert to binary labels
     y = (risk_score > 0.5).astype(int)
     
     # Normalize features
-    X = (X - X.mean(axis=0)) / (X.std(axis=0) + 1e-7)
+    if normalize:
+        if normalization is not None:
+            X = (X - np.asarray(normalization["mean"])) / np.asarray(normalization["std"])
+        else:
+            X = (X - X.mean(axis=0)) / (X.std(axis=0) + 1e-7)
     
     # Split into train/test
     X_train, X_test, y_train, y_test = train_test_split(
@@ -93,23 +86,26 @@ def generate_heart_disease_data(num_samples=200, client_id=0, seed=None):
     return X_train, X_test, y_train, y_test
 
 
-def generate_new_batch(client_id=0, batch_size=50):
+def generate_new_batch(client_id=0, batch_size=50, batch_index=0, normalization=None):
     """
     Generate a new batch of data for continual learning.
     
     Args:
         client_id: Client identifier
         batch_size: Number of samples in the new batch
+        batch_index: Sequence number of the batch (each index is a new arrival)
+        normalization: Global normalization statistics of the model being updated
     
     Returns:
         X_new, y_new: New data batch
     """
-    # Use a different seed for new batches
-    seed = 1000 + client_id
+    # Use a different seed for every new batch of every client
+    seed = 1000 + client_id + 100 * batch_index
     X_train, _, y_train, _ = generate_heart_disease_data(
         num_samples=batch_size, 
         client_id=client_id, 
-        seed=seed
+        seed=seed,
+        normalization=normalization
     )
     return X_train, y_train
 
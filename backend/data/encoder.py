@@ -0,0 +1,167 @@
+"""Feature encoding and federated normalization statistics."""
+
+from operator import itemgetter
+from typing import Dict, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
+
+from config import FEATURE_NAMES, FEATURE_DESCRIPTIONS
+
+FeatureInput = Union[Mapping[str, float], Sequence[float]]
+
+# bool is an int subclass but is rejected separately; strings and None are
+# rejected rather than coerced by numpy
+_NUMBER_TYPES = (int, float, np.integer, np.floating)
+
+
+class InvalidFeaturesError(ValueError):
+    """Raised when a raw clinical record does not match the input schema."""
+
+
+def compute_feature_statistics(X: np.ndarray) -> Dict:
+    """
+    Compute the sufficient statistics of one hospital's raw features.
+
+    Only these aggregates leave the hospital, never patient rows.
+
+    Args:
+        X: Raw feature matrix
+
+    Returns:
+        Dictionary with count, per-feature sum and sum of squares
+    """
+    X = np.asarray(X, dtype=np.float64)
+    return {
+        "count": int(len(X)),
+        "sum": X.sum(axis=0).tolist(),
+        "sum_sq": np.square(X).sum(axis=0).tolist()
+    }
+
+
+def aggregate_feature_statistics(client_statistics: List[Dict]) -> Dict:
+    """
+    Combine per-hospital statistics into global normalization statistics.
+
+    Args:
+        client_statistics: Outputs of compute_feature_statistics
+
+    Returns:
+        Dictionary with global count, mean and std (JSON-serializable)
+    """
+    count = sum(stats["count"] for stats in client_statistics)
+    total = np.sum([stats["sum"] for stats in client_statistics], axis=0)
+    total_sq = np.sum([stats["sum_sq"] for stats in client_statistics], axis=0)
+
+    mean = total / count
+    variance = np.maximum(total_sq / count - np.square(mean), 0.0)
+    return {
+        "count": int(count),
+        "mean": mean.tolist(),
+        "std": (np.sqrt(variance) + 1e-7).tolist()
+    }
+
+
+class FeatureEncoder:
+    """
+    Validates raw clinical inputs and encodes them as normalized model inputs.
+
+    The name-to-column mapping is built once from ``FEATURE_NAMES``;
+    dict and batch inputs are written straight into preallocated
+    contiguous float32 arrays, then normalized into one new array with
+    the statistics saved with the served model (the raw values are kept
+    for the explanation output).
+    """
+
+    def __init__(self, feature_names: Sequence[str] = FEATURE_NAMES, normalization: Optional[Dict] = None):
+        """
+        Initialize the encoder.
+
+        Args:
+            feature_names: Ordered model input names
+            normalization: Global {"mean", "std"} statistics (identity if None)
+        """
+        self.feature_names = tuple(feature_names)
+        self.num_features = len(self.feature_names)
+        self._name_set = frozenset(self.feature_names)
+        self._getter = itemgetter(*self.feature_names)
+        self.set_normalization(normalization)
+
+    def set_normalization(self, normalization: Optional[Dict]):
+        """Install the normalization statistics of the served model."""
+        if normalization is None:
+            mean = np.zeros(self.num_features, dtype=np.float32)
+            inv_std = np.ones(self.num_features, dtype=np.float32)
+        else:
+            mean = np.asarray(normalization["mean"], dtype=np.float32)
+            inv_std = (1.0 / np.asarray(normalization["std"], dtype=np.float32)).astype(np.float32)
+
+        # Swapped as one tuple so concurrent requests never mix two models' statistics
+        self._stats = (mean, inv_std)
+        self.normalization = normalization
+
+    def _fill_row(self, row: np.ndarray, features: FeatureInput):
+        """Validate one record and write its raw values into ``row``."""
+        if isinstance(features, Mapping):
+            if features.keys() != self._name_set:
+                missing = sorted(self._name_set - features.keys())
+                unknown = sorted(features.keys() - self._name_set)
+                raise InvalidFeaturesError(f"Invalid features: missing={missing}, unknown={unknown}")
+            values = self._getter(features)
+        else:
+            if len(features) != self.num_features:
+                raise InvalidFeaturesError(
+                    f"Expected {self.num_features} feature values, got {len(features)}"
+                )
+            values = features
+
+        for value in values:
+            if not isinstance(value, _NUMBER_TYPES) or isinstance(value, bool):
+                raise InvalidFeaturesError("Feature values must be numbers")
+        row[:] = values
+
+    def to_array(self, features: FeatureInput) -> np.ndarray:
+        """
+        Validate one record and return its raw values.
+
+        Args:
+            features: Dict keyed by feature name, or values in FEATURE_NAMES order
+
+        Returns:
+            Raw float32 array of shape (1, features)
+        """
+        raw = np.empty((1, self.num_features), dtype=np.float32)
+        self._fill_row(raw[0], features)
+        self._check_finite(raw)
+        return raw
+
+    def to_batch_array(self, records: Sequence[FeatureInput]) -> np.ndarray:
+        """Validate many records and return their raw values as one (N, features) array."""
+        raw = np.empty((len(records), self.num_features), dtype=np.float32)
+        for row, features in zip(raw, records):
+            self._fill_row(row, features)
+        self._check_finite(raw)
+        return raw
+
+    def normalize(self, raw: np.ndarray) -> np.ndarray:
+        """Return normalized model inputs for raw values (``raw`` is left unchanged)."""
+        mean, inv_std = self._stats
+        encoded = raw - mean
+        encoded *= inv_std
+        return encoded
+
+    @staticmethod
+    def _check_finite(raw: np.ndarray):
+        if not np.isfinite(raw).all():
+            raise InvalidFeaturesError("Feature values must be finite")
+
+    def describe(self) -> List[Dict]:
+        """Describe the expected input schema."""
+        return [
+            {
+                "name": name,
+                "description": FEATURE_DESCRIPTIONS.get(name, ""),
+                "mean": None if self.normalization is None else self.normalization["mean"][i],
+                "std": None if self.normalization is None else self.normalization["std"][i]
+            }
+            for i, name in enumerate(self.feature_names)
+        ]
@@ -1,6 +1,15 @@
 """Explainability package."""
 
 from .shap_explainer import ShapExplainer, explainer
+from .attribution import DeepLiftAttributor, ShapDeepAttributor
+from .global_importance import GlobalImportanceCache, global_importance
 
-__all__ = ['ShapExplainer', 'explainer']
+__all__ = [
+    'ShapExplainer',
+    'explainer',
+    'DeepLiftAttributor',
+    'ShapDeepAttributor',
+    'GlobalImportanceCache',
+    'global_importance'
+]
 
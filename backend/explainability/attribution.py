@@ -0,0 +1,192 @@
+"""Attribution engines used by the explainer."""
+
+import copy
+import threading
+from typing import Optional
+
+import numpy as np
+import torch
+import torch.nn as nn
+from sklearn.cluster import KMeans
+
+from config import ATTRIBUTION_BACKGROUND_CLUSTERS
+
+
+def summarize_background(background: np.ndarray, num_clusters: int):
+    """
+    Summarize background samples into weighted k-means centroids.
+
+    This is an approximation, not a compression: DeepLIFT is nonlinear in
+    the reference, so attributions against centroids differ from the
+    average over the full background (by up to ~0.17 per feature with 10
+    centroids on the trained heart model, and the expected value moves
+    too). Only use it when the background is too large to explain against.
+
+    Args:
+        background: Background feature matrix
+        num_clusters: Number of centroids to keep
+
+    Returns:
+        centroids, weights: Reference points and their probability weights
+    """
+    background = np.asarray(background, dtype=np.float32)
+    if len(background) <= num_clusters:
+        weights = np.full(len(background), 1.0 / len(background), dtype=np.float32)
+        return background, weights
+
+    kmeans = KMeans(n_clusters=num_clusters, n_init=10, random_state=0).fit(background)
+    counts = np.bincount(kmeans.labels_, minlength=num_clusters)
+    weights = (counts / counts.sum()).astype(np.float32)
+    return kmeans.cluster_centers_.astype(np.float32), weights
+
+
+class DeepLiftAttributor:
+    """
+    DeepLIFT (rescale rule) attributions for the Linear/ReLU/Sigmoid heart model.
+
+    All inputs of a batch are explained against all reference points at
+    once with batched matrix products; the per-reference attributions are
+    then averaged with the background weights. With the full background
+    (the default) this matches shap.DeepExplainer on the same model, which
+    tests/test_attribution.py checks.
+    """
+
+    def __init__(
+        self,
+        model: nn.Module,
+        background: np.ndarray,
+        num_clusters: Optional[int] = ATTRIBUTION_BACKGROUND_CLUSTERS
+    ):
+        """
+        Snapshot the model weights and precompute reference activations.
+
+        Args:
+            model: Trained HeartDiseaseModel
+            background: Background feature matrix
+            num_clusters: Summarize the background into this many k-means
+                centroids (approximate, see summarize_background); the
+                full background is used if None
+        """
+        self.layers = [
+            (module.weight.detach().clone(), module.bias.detach().clone())
+            for module in model.modules()
+            if isinstance(module, nn.Linear)
+        ]
+
+        if num_clusters is None:
+            centroids = np.asarray(background, dtype=np.float32)
+            weights = np.full(len(centroids), 1.0 / len(centroids), dtype=np.float32)
+        else:
+            centroids, weights = summarize_background(background, num_clusters)
+        self.ref_x = torch.from_numpy(centroids)
+        self.ref_weights = torch.from_numpy(weights)
+
+        with torch.no_grad():
+            self.ref_pre, self.ref_out = self._forward(self.ref_x)
+            self.expected_value = float(self.ref_weights @ torch.sigmoid(self.ref_out[:, 0]))
+
+    def _forward(self, x: torch.Tensor):
+        """Return hidden pre-activations and output logits."""
+        pre_activations = []
+        h = x
+        for weight, bias in self.layers[:-1]:
+            z = torch.addmm(bias, h, weight.t())
+            pre_activations.append(z)
+            h = torch.relu(z)
+        weight, bias = self.layers[-1]
+        return pre_activations, torch.addmm(bias, h, weight.t())
+
+    @torch.no_grad()
+    def with_output_layer(self, weight: torch.Tensor, bias: torch.Tensor) -> "DeepLiftAttributor":
+        """
+        Return an attributor for the same body with a different output head.
+
+        Reference activations of the body are shared; only the reference
+        output is recomputed, so this is cheap enough to do per request.
+        """
+        attributor = copy.copy(self)
+        attributor.layers = self.layers[:-1] + [(weight, bias)]
+        attributor.ref_out = torch.addmm(bias, torch.relu(self.ref_pre[-1]), weight.t())
+        attributor.expected_value = float(
+            self.ref_weights @ torch.sigmoid(attributor.ref_out[:, 0])
+        )
+        return attributor
+
+    @staticmethod
+    def _rescale(z_x: torch.Tensor, z_ref: torch.Tensor, fn, grad_fn) -> torch.Tensor:
+        """Rescale-rule multiplier, falling back to the gradient when inputs coincide."""
+        delta = z_x - z_ref
+        near = delta.abs() < 1e-6
+        safe_delta = torch.where(near, torch.ones_like(delta), delta)
+        return torch.where(near, grad_fn(z_x), (fn(z_x) - fn(z_ref)) / safe_delta)
+
+    @staticmethod
+    def _relu_grad(z: torch.Tensor) -> torch.Tensor:
+        return (z > 0).to(z.dtype)
+
+    @staticmethod
+    def _sigmoid_grad(z: torch.Tensor) -> torch.Tensor:
+        s = torch.sigmoid(z)
+        return s * (1 - s)
+
+    @torch.no_grad()
+    def attribute(self, X: np.ndarray) -> np.ndarray:
+        """
+        Compute attributions for a batch of inputs.
+
+        Args:
+            X: Feature matrix of shape (batch, features)
+
+        Returns:
+            Attributions of shape (batch, features)
+        """
+        x = torch.as_tensor(np.asarray(X, dtype=np.float32))
+        pre_x, out_x = self._forward(x)
+
+        # Multipliers have shape (batch, references, units)
+        multipliers = self._rescale(
+            out_x[:, None, :], self.ref_out[None], torch.sigmoid, self._sigmoid_grad
+        )
+        multipliers = multipliers @ self.layers[-1][0]
+
+        for (weight, _), z_x, z_ref in zip(
+            reversed(self.layers[:-1]), reversed(pre_x), reversed(self.ref_pre)
+        ):
+            multipliers = multipliers * self._rescale(
+                z_x[:, None, :], z_ref[None], torch.relu, self._relu_grad
+            )
+            multipliers = multipliers @ weight
+
+        contributions = multipliers * (x[:, None, :] - self.ref_x[None])
+        return torch.einsum("bkf,k->bf", contributions, self.ref_weights).numpy()
+
+
+class ShapDeepAttributor:
+    """Attributions from shap.DeepExplainer, kept for comparison with the native engine."""
+
+    def __init__(self, model: nn.Module, background: torch.Tensor):
+        """Create the DeepExplainer (shap is only imported when this backend is used)."""
+        import shap
+
+        self.model = model
+        self.background = background
+        self.explainer = shap.DeepExplainer(model, background)
+        self.expected_value = float(np.ravel(self.explainer.expected_value)[0])
+        # DeepExplainer installs hooks on the model and is not thread-safe
+        self._lock = threading.Lock()
+
+    def with_output_layer(self, weight: torch.Tensor, bias: torch.Tensor) -> "ShapDeepAttributor":
+        """Return an attributor for a copy of the model with a different output head."""
+        model = copy.deepcopy(self.model)
+        with torch.no_grad():
+            model.fc4.weight.copy_(weight)
+            model.fc4.bias.copy_(bias)
+        return ShapDeepAttributor(model, self.background)
+
+    def attribute(self, X: np.ndarray) -> np.ndarray:
+        """Compute attributions for a batch of inputs."""
+        with self._lock:
+            shap_values = self.explainer.shap_values(torch.as_tensor(np.asarray(X, dtype=np.float32)))
+        if isinstance(shap_values, list):
+            shap_values = shap_values[0]
+        return np.asarray(shap_values).reshape(len(X), -1)
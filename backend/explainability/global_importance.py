@@ -0,0 +1,220 @@
+"""Population-level feature importance computed over an evaluation cohort."""
+
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+
+import numpy as np
+
+from data.dataset import generate_heart_disease_data
+from config import (
+    ARTIFACTS_DIR,
+    FEATURE_NAMES,
+    GLOBAL_IMPORTANCE_CHUNK_SIZE,
+    GLOBAL_IMPORTANCE_COHORT_SIZE,
+    GLOBAL_IMPORTANCE_WORKERS,
+    NUM_CLIENTS,
+)
+
+PERCENTILES = [5, 25, 50, 75, 95]
+
+
+def build_evaluation_cohort(
+    normalization: Optional[Dict] = None,
+    cohort_size: int = GLOBAL_IMPORTANCE_COHORT_SIZE
+) -> np.ndarray:
+    """
+    Build an evaluation cohort pooled across all hospitals.
+
+    Args:
+        normalization: Normalization statistics of the explained model
+        cohort_size: Approximate total number of patients
+
+    Returns:
+        Float32 feature matrix of shape (patients, features)
+    """
+    per_client = max(2, cohort_size // NUM_CLIENTS)
+    parts = []
+    for client_id in range(NUM_CLIENTS):
+        # Separate seed range so the cohort does not overlap training data
+        X_train, X_test, _, _ = generate_heart_disease_data(
+            num_samples=per_client,
+            client_id=client_id,
+            seed=2000 + client_id,
+            normalization=normalization
+        )
+        parts.extend([X_train, X_test])
+    return np.ascontiguousarray(np.concatenate(parts), dtype=np.float32)
+
+
+def compute_global_importance(
+    attributor,
+    cohort: np.ndarray,
+    chunk_size: int = GLOBAL_IMPORTANCE_CHUNK_SIZE,
+    num_workers: int = GLOBAL_IMPORTANCE_WORKERS
+) -> Dict:
+    """
+    Compute SHAP values for a cohort in chunks and summarize them.
+
+    Only one chunk of intermediate activations per worker is held in
+    memory at a time; attributions are written into a single
+    preallocated output array.
+
+    Args:
+        attributor: Attribution engine with an ``attribute`` method
+        cohort: Feature matrix to explain
+        chunk_size: Number of patients per chunk
+        num_workers: Number of parallel workers
+
+    Returns:
+        Dictionary with per-feature importance summaries
+    """
+    values = np.empty(cohort.shape, dtype=np.float32)
+
+    def explain_chunk(start: int):
+        stop = min(start + chunk_size, len(cohort))
+        values[start:stop] = attributor.attribute(cohort[start:stop])
+
+    with ThreadPoolExecutor(max_workers=num_workers) as pool:
+        # Consume the iterator so worker exceptions are raised here
+        list(pool.map(explain_chunk, range(0, len(cohort), chunk_size)))
+
+    return summarize_attributions(values, cohort)
+
+
+def summarize_attributions(values: np.ndarray, cohort: np.ndarray) -> Dict:
+    """
+    Summarize a matrix of attributions into per-feature statistics.
+
+    Args:
+        values: Attributions of shape (patients, features)
+        cohort: Feature values of the same shape
+
+    Returns:
+        Dictionary containing features sorted by mean absolute SHAP value
+    """
+    abs_values = np.abs(values)
+    percentiles = np.percentile(values, PERCENTILES, axis=0)
+
+    features = []
+    for i, name in enumerate(FEATURE_NAMES):
+        # Direction of effect: does a higher feature value push risk up?
+        if values[:, i].std() > 0 and cohort[:, i].std() > 0:
+            correlation = float(np.corrcoef(cohort[:, i], values[:, i])[0, 1])
+        else:
+            correlation = 0.0
+
+        features.append({
+            "feature": name,
+            "mean_abs_shap": float(abs_values[:, i].mean()),
+            "mean_shap": float(values[:, i].mean()),
+            "std_shap": float(values[:, i].std()),
+            "percentiles": {
+                f"p{p}": float(percentiles[j, i]) for j, p in enumerate(PERCENTILES)
+            },
+            "value_correlation": correlation
+        })
+
+    features.sort(key=lambda x: x["mean_abs_shap"], reverse=True)
+
+    return {
+        "num_samples": int(len(values)),
+        "feature_importance": features
+    }
+
+
+class GlobalImportanceCache:
+    """Computes global importance in the background and caches it per model version."""
+
+    def __init__(self, cache_dir: str = os.path.join(ARTIFACTS_DIR, "global_importance")):
+        """Initialize the cache."""
+        self.cache_dir = cache_dir
+        self._artifacts = {}
+        self._pending = set()
+        self._errors = {}
+        self._lock = threading.Lock()
+
+    def _path(self, model_version: str) -> str:
+        return os.path.join(self.cache_dir, f"{model_version}.json")
+
+    def get(self, model_version: str) -> Optional[Dict]:
+        """Return the precomputed artifact for a model version, if any."""
+        with self._lock:
+            if model_version in self._artifacts:
+                return self._artifacts[model_version]
+
+        path = self._path(model_version)
+        if not os.path.exists(path):
+            return None
+
+        with open(path) as f:
+            artifact = json.load(f)
+        with self._lock:
+            self._artifacts[model_version] = artifact
+        return artifact
+
+    def status(self, model_version: str) -> str:
+        """Return one of: ready, pending, error, missing."""
+        with self._lock:
+            if model_version in self._pending:
+                return "pending"
+            if model_version in self._errors:
+                return "error"
+        return "ready" if self.get(model_version) is not None else "missing"
+
+    def error(self, model_version: str) -> Optional[str]:
+        """Return the error message of a failed computation, if any."""
+        with self._lock:
+            return self._errors.get(model_version)
+
+    def schedule(self, model_version: str, attributor, normalization: Optional[Dict] = None):
+        """
+        Start computing the artifact for a model version in a background thread.
+
+        Does nothing if the artifact already exists or is being computed.
+        """
+        if self.get(model_version) is not None:
+            return
+
+        with self._lock:
+            if model_version in self._pending:
+                return
+            self._pending.add(model_version)
+            self._errors.pop(model_version, None)
+
+        thread = threading.Thread(
+            target=self._compute,
+            args=(model_version, attributor, normalization),
+            daemon=True
+        )
+        thread.start()
+
+    def _compute(self, model_version: str, attributor, normalization: Optional[Dict]):
+        """Compute and persist the artifact (executed in background thread)."""
+        try:
+            cohort = build_evaluation_cohort(normalization)
+            artifact = compute_global_importance(attributor, cohort)
+            artifact["model_version"] = model_version
+
+            # Write atomically so readers never see a partial file
+            os.makedirs(self.cache_dir, exist_ok=True)
+            path = self._path(model_version)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(artifact, f)
+            os.replace(tmp_path, path)
+
+            with self._lock:
+                self._artifacts[model_version] = artifact
+        except Exception as e:
+            with self._lock:
+                self._errors[model_version] = str(e)
+        finally:
+            with self._lock:
+                self._pending.discard(model_version)
+
+
+# Global cache instance
+global_importance = GlobalImportanceCache()
@@ -1,111 +1,196 @@
 """SHAP explainability for model predictions."""
 
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, List, Optional, Tuple
+
 import torch
 import numpy as np
-import shap
-from typing import Dict, List
 
 from models.heart_model import HeartDiseaseModel
 from data.dataset import generate_heart_disease_data
-from config import FEATURE_NAMES, SHAP_BACKGROUND_SAMPLES
+from data.encoder import FeatureEncoder, FeatureInput
+from explainability.attribution import DeepLiftAttributor, ShapDeepAttributor
+from config import FEATURE_NAMES, SHAP_BACKGROUND_SAMPLES, EXPLAINER_BACKEND, PERSONALIZED_CACHE_SIZE
 
 
 class ShapExplainer:
     """SHAP-based model explainer."""
     
-    def __init__(self):
-        """Initialize the explainer."""
+    def __init__(self, backend: str = EXPLAINER_BACKEND):
+        """
+        Initialize the explainer.
+        
+        Args:
+            backend: "native" for the built-in DeepLIFT engine,
+                "shap" for shap.DeepExplainer
+        """
+        if backend not in ("native", "shap"):
+            raise ValueError(f"Unknown explainer backend: {backend}")
+        
+        self.backend = backend
         self.model = None
-        self.explainer = None
+        self.serving_model = None
+        self.attributor = None
         self.background_data = None
+        self.encoder = FeatureEncoder()
+        # Attributors for personalized heads; building one is expensive
+        # with the shap backend (model copy plus a new DeepExplainer)
+        self._head_attributors = OrderedDict()
+        self._head_lock = threading.Lock()
     
-    def setup(self, model: HeartDiseaseModel):
+    def setup(self, model: HeartDiseaseModel, serving_model=None, normalization: Optional[Dict] = None):
         """
         Set up the explainer with a trained model.
         
         Args:
-            model: Trained PyTorch model
+            model: Trained fp32 PyTorch model (used for attributions)
+            serving_model: Optional reduced-precision variant used for predictions
+            normalization: Normalization statistics saved with the model
         """
         self.model = model
         self.model.eval()
+        self.serving_model = serving_model if serving_model is not None else model
+        self.encoder.set_normalization(normalization)
         
         # Generate background data for SHAP
         X_train, _, _, _ = generate_heart_disease_data(
             num_samples=SHAP_BACKGROUND_SAMPLES,
-            client_id=0
+            client_id=0,
+            normalization=normalization
         )
         self.background_data = torch.FloatTensor(X_train)
         
-        # Create SHAP explainer
-        # Using DeepExplainer for neural networks
-        self.explainer = shap.DeepExplainer(self.model, self.background_data)
+        if self.backend == "native":
+            self.attributor = DeepLiftAttributor(self.model, X_train)
+        else:
+            self.attributor = ShapDeepAttributor(self.model, self.background_data)
+        
+        with self._head_lock:
+            self._head_attributors.clear()
     
-    def explain_prediction(self, features: List[float]) -> Dict:
+    def explain_prediction(
+        self,
+        features: FeatureInput,
+        head: Optional[Tuple[torch.Tensor, torch.Tensor]] = None,
+        head_key: Optional[Hashable] = None
+    ) -> Dict:
         """
         Explain a single prediction using SHAP values.
         
         Args:
-            features: List of feature values
+            features: Raw feature values keyed by feature name
+                (or a list in FEATURE_NAMES order)
+            head: Optional personalized (weight, bias) output layer used on
+                top of the shared model body
+            head_key: Identifies the head (e.g. model version and hospital)
+                so its attributor is built once and reused
         
         Returns:
             Dictionary containing prediction and SHAP values
         """
-        if self.model is None or self.explainer is None:
-            # If model not trained, return dummy explanation
-            return self._get_dummy_explanation(features)
+        raw = self.encoder.to_array(features)
         
-        # Convert to tensor
-        input_tensor = torch.FloatTensor([features])
+        if self.model is None or self.attributor is None:
+            # If model not trained, return dummy explanation
+            return self._get_dummy_explanation(raw[0])
         
-        # Get prediction
-        with torch.no_grad():
-            prediction = self.model(input_tensor).item()
+        return self._explain(raw, self.encoder.normalize(raw), head, head_key)[0]
+    
+    def explain_batch(self, records: List[FeatureInput]) -> List[Dict]:
+        """
+        Explain many predictions with one batched forward and attribution pass.
         
-        # Get SHAP values
-        shap_values = self.explainer.shap_values(input_tensor)
+        Args:
+            records: Raw feature records
         
-        # Convert to list (handle different SHAP output formats)
-        if isinstance(shap_values, list):
-            shap_values = shap_values[0]
+        Returns:
+            List of explanation dictionaries, in input order
+        """
+        raw = self.encoder.to_batch_array(records)
         
-        shap_values = shap_values[0].tolist() if len(shap_values.shape) > 1 else shap_values.tolist()
+        if self.model is None or self.attributor is None:
+            return [self._get_dummy_explanation(row) for row in raw]
         
-        # Create feature importance list
-        feature_importance = [
-            {
-                "feature": FEATURE_NAMES[i],
-                "value": float(features[i]),
-                "shap_value": float(shap_values[i])
-            }
-            for i in range(len(features))
-        ]
+        return self._explain(raw, self.encoder.normalize(raw))
+    
+    def _head_attributor(self, head: Tuple[torch.Tensor, torch.Tensor], head_key: Optional[Hashable]):
+        """Return the attributor for a personalized head, cached under head_key."""
+        if head_key is None:
+            return self.attributor.with_output_layer(*head)
+        
+        with self._head_lock:
+            attributor = self._head_attributors.get(head_key)
+            if attributor is not None:
+                self._head_attributors.move_to_end(head_key)
+                return attributor
+        
+        attributor = self.attributor.with_output_layer(*head)
+        with self._head_lock:
+            self._head_attributors[head_key] = attributor
+            while len(self._head_attributors) > PERSONALIZED_CACHE_SIZE:
+                self._head_attributors.popitem(last=False)
+        return attributor
+    
+    def _explain(self, raw: np.ndarray, encoded: np.ndarray, head=None, head_key=None) -> List[Dict]:
+        """Predict and attribute a batch of encoded inputs."""
+        inputs = torch.from_numpy(encoded)
+        attributor = self.attributor
         
-        # Sort by absolute SHAP value
-        feature_importance.sort(key=lambda x: abs(x["shap_value"]), reverse=True)
+        # Get predictions
+        with torch.no_grad():
+            if head is None:
+                predictions = self.serving_model(inputs)
+            else:
+                weight, bias = head
+                hidden = self.serving_model.features(inputs)
+                predictions = torch.sigmoid(torch.addmm(bias, hidden, weight.t()))
+                attributor = self._head_attributor(head, head_key)
+        predictions = predictions.reshape(-1).tolist()
         
-        return {
-            "prediction": float(prediction),
-            "risk_level": "High" if prediction > 0.5 else "Low",
-            "confidence": float(abs(prediction - 0.5) * 2),  # 0 to 1
-            "feature_importance": feature_importance
-        }
+        # Get SHAP values
+        shap_values = attributor.attribute(encoded)
+        
+        explanations = []
+        for prediction, values, row_shap in zip(predictions, raw.tolist(), shap_values.tolist()):
+            # Create feature importance list
+            feature_importance = [
+                {
+                    "feature": FEATURE_NAMES[i],
+                    "value": float(values[i]),
+                    "shap_value": float(row_shap[i])
+                }
+                for i in range(len(values))
+            ]
+            
+            # Sort by absolute SHAP value
+            feature_importance.sort(key=lambda x: abs(x["shap_value"]), reverse=True)
+            
+            explanations.append({
+                "prediction": float(prediction),
+                "risk_level": "High" if prediction > 0.5 else "Low",
+                "confidence": float(abs(prediction - 0.5) * 2),  # 0 to 1
+                "feature_importance": feature_importance
+            })
+        
+        return explanations
     
-    def _get_dummy_explanation(self, features: List[float]) -> Dict:
+    def _get_dummy_explanation(self, features: np.ndarray) -> Dict:
         """
         Generate dummy explanation when model is not trained.
         
         Args:
-            features: List of feature values
+            features: Raw feature values in FEATURE_NAMES order
         
         Returns:
             Dummy explanation dictionary
         """
         # Simple rule-based prediction for demo
         risk_score = (
-            (features[0] > 0.5) * 0.3 +  # Age
+            (features[0] > 55) * 0.3 +    # Age
             (features[1] > 0) * 0.2 +     # Sex
-            (features[3] > 0.5) * 0.2 +   # BP
-            (features[4] > 0.5) * 0.3     # Cholesterol
+            (features[3] > 140) * 0.2 +   # BP
+            (features[4] > 240) * 0.3     # Cholesterol
         )
         
         prediction = min(0.9, max(0.1, risk_score))
@@ -1,13 +1,27 @@
 """Federated learning package."""
 
 from .client import HeartDiseaseClient, create_client
-from .server import get_federated_strategy
+from .server import HeartDiseaseStrategy, get_federated_strategy, STRATEGIES
+from .server_optim import ServerOptimizer
+from .aggregation import AggregationEngine
+from .client_pool import ClientPool, client_pool
+from .pipeline import PipelinedRoundScheduler
+from .personalization import fine_tune_head, personalize_hospitals
 from .simulation import run_federated_simulation, extract_training_history
 
 __all__ = [
     'HeartDiseaseClient',
     'create_client',
+    'HeartDiseaseStrategy',
     'get_federated_strategy',
+    'STRATEGIES',
+    'ServerOptimizer',
+    'AggregationEngine',
+    'ClientPool',
+    'client_pool',
+    'PipelinedRoundScheduler',
+    'fine_tune_head',
+    'personalize_hospitals',
     'run_federated_simulation',
     'extract_training_history'
 ]
\ No newline at end of file
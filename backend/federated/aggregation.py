@@ -0,0 +1,125 @@
+"""Vectorized aggregation of client updates."""
+
+from typing import List, Optional
+
+import numpy as np
+
+from config import AGGREGATION_RULE, TRIM_RATIO, CLIP_NORM
+
+AGGREGATION_RULES = ("fedavg", "median", "trimmed_mean", "clipped_fedavg")
+
+
+class AggregationEngine:
+    """
+    Aggregates client updates as reductions over one stacked array.
+
+    Every client update is flattened into a row of a preallocated
+    (clients x params) buffer, and each rule is a single vectorized
+    reduction over that buffer. Buffers are kept between rounds and
+    only grow when more clients report than ever before.
+    """
+
+    def __init__(
+        self,
+        rule: str = AGGREGATION_RULE,
+        trim_ratio: float = TRIM_RATIO,
+        clip_norm: float = CLIP_NORM
+    ):
+        """
+        Initialize the engine.
+
+        Args:
+            rule: One of "fedavg", "median", "trimmed_mean", "clipped_fedavg"
+            trim_ratio: Fraction of clients trimmed from each end (trimmed_mean)
+            clip_norm: Maximum L2 norm of a client update (clipped_fedavg)
+        """
+        if rule not in AGGREGATION_RULES:
+            raise ValueError(f"Unknown aggregation rule: {rule}")
+        if not 0 <= trim_ratio < 0.5:
+            raise ValueError("trim_ratio must be in [0, 0.5)")
+
+        self.rule = rule
+        self.trim_ratio = trim_ratio
+        self.clip_norm = clip_norm
+
+        self._stacked = None
+        self._result = None
+        self._shapes = None
+
+    def _stack(self, updates: List[List[np.ndarray]]) -> np.ndarray:
+        """Copy client updates into the reusable (clients x params) buffer."""
+        shapes = [array.shape for array in updates[0]]
+        num_params = sum(int(np.prod(shape)) for shape in shapes)
+
+        if (
+            self._stacked is None
+            or self._stacked.shape[0] < len(updates)
+            or self._stacked.shape[1] != num_params
+        ):
+            self._stacked = np.empty((len(updates), num_params), dtype=np.float32)
+            self._result = np.empty(num_params, dtype=np.float32)
+        self._shapes = shapes
+
+        stacked = self._stacked[:len(updates)]
+        for row, parameters in zip(stacked, updates):
+            np.concatenate([array.ravel() for array in parameters], out=row)
+        return stacked
+
+    def _flatten(self, parameters: List[np.ndarray]) -> np.ndarray:
+        return np.concatenate([array.ravel() for array in parameters]).astype(np.float32, copy=False)
+
+    def _unflatten(self, flat: np.ndarray) -> List[np.ndarray]:
+        """Split a flat vector into arrays of the model's shapes."""
+        # Copy once: the result buffer is overwritten next round
+        flat = flat.copy()
+        arrays, offset = [], 0
+        for shape in self._shapes:
+            size = int(np.prod(shape))
+            arrays.append(flat[offset:offset + size].reshape(shape))
+            offset += size
+        return arrays
+
+    def aggregate(
+        self,
+        updates: List[List[np.ndarray]],
+        num_examples: List[int],
+        reference: Optional[List[np.ndarray]] = None
+    ) -> List[np.ndarray]:
+        """
+        Aggregate client updates with the configured rule.
+
+        Args:
+            updates: Parameters returned by each client
+            num_examples: Number of training examples of each client
+            reference: Global parameters the clients started from
+                (required to clip updates; without it clipped_fedavg
+                falls back to the weighted mean)
+
+        Returns:
+            Aggregated parameters
+        """
+        stacked = self._stack(updates)
+        weights = np.asarray(num_examples, dtype=np.float32)
+        weights /= weights.sum()
+
+        if self.rule == "median":
+            np.median(stacked, axis=0, out=self._result)
+
+        elif self.rule == "trimmed_mean":
+            trim = int(self.trim_ratio * len(updates))
+            # The stacked buffer is scratch space, so sort it in place
+            stacked.sort(axis=0)
+            stacked[trim:len(updates) - trim].mean(axis=0, out=self._result)
+
+        elif self.rule == "clipped_fedavg" and reference is not None:
+            reference_flat = self._flatten(reference)
+            np.subtract(stacked, reference_flat, out=stacked)
+            norms = np.linalg.norm(stacked, axis=1)
+            scales = np.minimum(1.0, self.clip_norm / np.maximum(norms, 1e-12))
+            np.dot((weights * scales).astype(np.float32), stacked, out=self._result)
+            self._result += reference_flat
+
+        else:
+            np.dot(weights, stacked, out=self._result)
+
+        return self._unflatten(self._result)
@@ -0,0 +1,227 @@
+"""
+Compare federated strategies by rounds and wall-clock time to a target accuracy.
+
+Held-out labels are imbalanced, so a model predicting the majority class
+already scores well above 0.5. Targets are therefore given as a margin
+over that majority-class baseline (or as an absolute accuracy, which must
+be above it).
+
+Examples (run from the backend directory):
+    python -m federated.benchmark --margin 0.05
+    python -m federated.benchmark --target 0.9
+    python -m federated.benchmark --strategies fedavg,fedadam --max-rounds 30 --pipelined
+    python -m federated.benchmark --repeats 3 --output benchmark.json
+"""
+
+import argparse
+import json
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+import torch
+
+from models.heart_model import HeartDiseaseModel, get_parameters
+from federated.server import STRATEGIES
+from federated.simulation import run_federated_simulation, compute_global_normalization
+from data.dataset import generate_heart_disease_data
+from config import NUM_CLIENTS, SAMPLES_PER_CLIENT, PIPELINED_ROUNDS
+
+DEFAULT_TARGET_MARGIN = 0.05  # Accuracy above the majority-class baseline
+DEFAULT_MAX_ROUNDS = 20
+
+
+def majority_class_baseline() -> float:
+    """Accuracy of always predicting the majority class on the pooled held-out splits."""
+    labels = np.concatenate([
+        generate_heart_disease_data(
+            num_samples=SAMPLES_PER_CLIENT,
+            client_id=client_id,
+            normalize=False
+        )[3]
+        for client_id in range(NUM_CLIENTS)
+    ])
+    positive_rate = float(labels.mean())
+    return max(positive_rate, 1.0 - positive_rate)
+
+
+def benchmark_strategy(
+    strategy_name: str,
+    target_accuracy: float,
+    max_rounds: int,
+    initial_parameters: List[np.ndarray],
+    normalization: Dict,
+    pipelined: bool,
+    seed: int
+) -> Dict:
+    """
+    Train with one strategy and time the rounds until the target accuracy.
+
+    Args:
+        strategy_name: Strategy from federated.server.STRATEGIES
+        target_accuracy: Federated evaluation accuracy to reach
+        max_rounds: Rounds to run (the target may not be reached)
+        initial_parameters: Global model every strategy starts from
+        normalization: Global normalization statistics
+        pipelined: Use the in-process pipelined scheduler
+        seed: Seed for client shuffling and dropout
+
+    Returns:
+        Rounds and seconds to target (None if not reached) and the
+        per-round accuracy curve
+    """
+    torch.manual_seed(seed)
+
+    round_times = []
+    started = time.perf_counter()
+
+    def on_round_end(record: Dict):
+        round_times.append(time.perf_counter() - started)
+
+    results = run_federated_simulation(
+        num_rounds=max_rounds,
+        initial_parameters=initial_parameters,
+        on_round_end=on_round_end,
+        normalization=normalization,
+        pipelined=pipelined,
+        strategy_name=strategy_name
+    )
+    elapsed = time.perf_counter() - started
+
+    curve = [record["accuracy"] for record in results["round_history"]]
+    rounds_to_target = next(
+        (i + 1 for i, accuracy in enumerate(curve)
+         if accuracy is not None and accuracy >= target_accuracy),
+        None
+    )
+    return {
+        "strategy": strategy_name,
+        "rounds_to_target": rounds_to_target,
+        # Pipelined runs report a round once its overlapped evaluation is reconciled
+        "seconds_to_target": round_times[rounds_to_target - 1] if rounds_to_target else None,
+        "total_seconds": elapsed,
+        "final_accuracy": curve[-1] if curve else None,
+        "best_accuracy": max((a for a in curve if a is not None), default=None),
+        "accuracy_curve": curve,
+    }
+
+
+def run_benchmark(
+    strategies: Optional[List[str]] = None,
+    target_accuracy: Optional[float] = None,
+    target_margin: float = DEFAULT_TARGET_MARGIN,
+    max_rounds: int = DEFAULT_MAX_ROUNDS,
+    pipelined: bool = PIPELINED_ROUNDS,
+    repeats: int = 1,
+    seed: int = 0
+) -> Dict:
+    """
+    Benchmark strategies from the same initial model and data.
+
+    Args:
+        strategies: Strategy names (all of STRATEGIES if None)
+        target_accuracy: Federated evaluation accuracy to reach (must be
+            above the majority-class baseline)
+        target_margin: Used when target_accuracy is None: the target is
+            the majority-class baseline plus this margin
+        max_rounds: Maximum rounds per run
+        pipelined: Use the in-process pipelined scheduler
+        repeats: Runs per strategy, each from a different initial model
+        seed: Base seed
+
+    Returns:
+        JSON-serializable report
+    """
+    strategies = strategies or list(STRATEGIES)
+    unknown = set(strategies) - set(STRATEGIES)
+    if unknown:
+        raise ValueError(f"Unknown strategies: {sorted(unknown)}")
+
+    baseline = majority_class_baseline()
+    if target_accuracy is None:
+        target_accuracy = baseline + target_margin
+    if target_accuracy <= baseline:
+        raise ValueError(
+            f"Target accuracy {target_accuracy:.3f} does not beat the "
+            f"majority-class baseline {baseline:.3f}"
+        )
+    if target_accuracy >= 1.0:
+        raise ValueError(f"Target accuracy {target_accuracy:.3f} is unreachable")
+
+    normalization = compute_global_normalization()
+    runs = {name: [] for name in strategies}
+
+    for repeat in range(repeats):
+        torch.manual_seed(seed + repeat)
+        initial_parameters = get_parameters(HeartDiseaseModel())
+        for name in strategies:
+            runs[name].append(benchmark_strategy(
+                name, target_accuracy, max_rounds, initial_parameters,
+                normalization, pipelined, seed + repeat
+            ))
+
+    summary = {}
+    for name, results in runs.items():
+        reached = [r for r in results if r["rounds_to_target"] is not None]
+        finals = [r["final_accuracy"] for r in results if r["final_accuracy"] is not None]
+        summary[name] = {
+            "reached_target": f"{len(reached)}/{len(results)}",
+            "median_rounds_to_target": (
+                float(np.median([r["rounds_to_target"] for r in reached])) if reached else None
+            ),
+            "median_seconds_to_target": (
+                float(np.median([r["seconds_to_target"] for r in reached])) if reached else None
+            ),
+            "mean_final_accuracy": float(np.mean(finals)) if finals else None,
+        }
+
+    return {
+        "config": {
+            "strategies": strategies,
+            "majority_class_baseline": baseline,
+            "target_accuracy": target_accuracy,
+            "max_rounds": max_rounds,
+            "pipelined": pipelined,
+            "repeats": repeats,
+            "seed": seed,
+        },
+        "summary": summary,
+        "runs": runs,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rounds and time to target accuracy per federated strategy")
+    parser.add_argument("--strategies", default=",".join(STRATEGIES),
+                        help="Comma-separated strategies, e.g. fedavg,fedadam")
+    parser.add_argument("--target", type=float,
+                        help="Absolute accuracy to reach (must beat the majority-class baseline)")
+    parser.add_argument("--margin", type=float, default=DEFAULT_TARGET_MARGIN,
+                        help="Target = majority-class baseline + margin (when --target is not set)")
+    parser.add_argument("--max-rounds", type=int, default=DEFAULT_MAX_ROUNDS)
+    parser.add_argument("--pipelined", action="store_true", default=PIPELINED_ROUNDS,
+                        help="Run rounds in-process with the pipelined scheduler")
+    parser.add_argument("--repeats", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    args = parser.parse_args()
+
+    report = run_benchmark(
+        strategies=[name.strip() for name in args.strategies.split(",")],
+        target_accuracy=args.target,
+        target_margin=args.margin,
+        max_rounds=args.max_rounds,
+        pipelined=args.pipelined,
+        repeats=args.repeats,
+        seed=args.seed,
+    )
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
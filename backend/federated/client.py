@@ -1,5 +1,7 @@
 """Flower client for federated learning."""
 
+import copy
+import threading
 import torch
 import torch.nn as nn
 from torch.utils.data import DataLoader, TensorDataset
@@ -8,13 +10,23 @@ import flwr as fl
 import numpy as np
 
 from models.heart_model import get_parameters, set_parameters
-from config import BATCH_SIZE, LOCAL_EPOCHS, LEARNING_RATE
+from models.precision import training_autocast
+from config import BATCH_SIZE, LOCAL_EPOCHS, LEARNING_RATE, TRAINING_PRECISION, KEEP_OPTIMIZER_STATE
 
 
 class HeartDiseaseClient(fl.client.NumPyClient):
     """Flower client for federated heart disease prediction."""
     
-    def __init__(self, model, X_train, y_train, X_test, y_test):
+    def __init__(
+        self,
+        model,
+        X_train,
+        y_train,
+        X_test,
+        y_test,
+        precision=TRAINING_PRECISION,
+        keep_optimizer_state=KEEP_OPTIMIZER_STATE
+    ):
         """
         Initialize client with model and data.
         
@@ -22,8 +34,18 @@ class HeartDiseaseClient(fl.client.NumPyClient):
             model: PyTorch model
             X_train, y_train: Training data
             X_test, y_test: Test data
+            precision: Local training precision ("fp32" or "bf16")
+            keep_optimizer_state: Keep optimizer moments between fit calls
+                when the client is reused across rounds
         """
         self.model = model
+        # Separate copy so evaluating one round can overlap training the next
+        self.eval_model = copy.deepcopy(model)
+        # Overlapping rounds may evaluate the same client twice at once;
+        # both would load their weights into the one eval_model
+        self._eval_lock = threading.Lock()
+        self.precision = precision
+        self.keep_optimizer_state = keep_optimizer_state
         self.X_train = torch.FloatTensor(X_train)
         self.y_train = torch.FloatTensor(y_train).reshape(-1, 1)
         self.X_test = torch.FloatTensor(X_test)
@@ -54,10 +76,24 @@ class HeartDiseaseClient(fl.client.NumPyClient):
         return get_parameters(self.model)
     
     def fit(self, parameters: List[np.ndarray], config: Dict) -> Tuple[List[np.ndarray], int, Dict]:
-        """Train the model on local data."""
+        """
+        Train the model on local data.
+        
+        A positive config["proximal_mu"] adds the FedProx term
+        mu / 2 * ||w - w_global||^2, keeping heterogeneous clients close
+        to the global model.
+        """
         # Set model parameters
         set_parameters(self.model, parameters)
         
+        proximal_mu = float(config.get("proximal_mu", 0.0))
+        global_weights = None
+        if proximal_mu > 0:
+            global_weights = [p.detach().clone() for p in self.model.parameters()]
+        
+        if not self.keep_optimizer_state:
+            self.optimizer.state.clear()
+        
         # Train
         self.model.train()
         epoch_losses = []
@@ -66,8 +102,15 @@ class HeartDiseaseClient(fl.client.NumPyClient):
             batch_losses = []
             for X_batch, y_batch in self.train_loader:
                 self.optimizer.zero_grad()
-                outputs = self.model(X_batch)
-                loss = self.criterion(outputs, y_batch)
+                with training_autocast(self.precision):
+                    outputs = self.model(X_batch)
+                # BCELoss is computed in fp32 for numerical stability
+                loss = self.criterion(outputs.float(), y_batch)
+                if global_weights is not None:
+                    proximal = sum(
+                        (p - g).pow(2).sum() for p, g in zip(self.model.parameters(), global_weights)
+                    )
+                    loss = loss + proximal_mu / 2 * proximal
                 loss.backward()
                 self.optimizer.step()
                 batch_losses.append(loss.item())
@@ -79,30 +122,31 @@ class HeartDiseaseClient(fl.client.NumPyClient):
         return (
             get_parameters(self.model),
             len(self.X_train),
-            {"train_loss": float(np.mean(epoch_losses))}
+            {"train_loss": float(np.mean(epoch_losses)), "precision": self.precision}
         )
     
     def evaluate(self, parameters: List[np.ndarray], config: Dict) -> Tuple[float, int, Dict]:
         """Evaluate the model on local test data."""
-        # Set model parameters
-        set_parameters(self.model, parameters)
-        
-        # Evaluate
-        self.model.eval()
-        total_loss = 0.0
-        correct = 0
-        total = 0
-        
-        with torch.no_grad():
-            for X_batch, y_batch in self.test_loader:
-                outputs = self.model(X_batch)
-                loss = self.criterion(outputs, y_batch)
-                total_loss += loss.item() * len(X_batch)
-                
-                # Calculate accuracy
-                predictions = (outputs >= 0.5).float()
-                correct += (predictions == y_batch).sum().item()
-                total += len(y_batch)
+        with self._eval_lock:
+            # Set model parameters
+            set_parameters(self.eval_model, parameters)
+            
+            # Evaluate
+            self.eval_model.eval()
+            total_loss = 0.0
+            correct = 0
+            total = 0
+            
+            with torch.no_grad():
+                for X_batch, y_batch in self.test_loader:
+                    outputs = self.eval_model(X_batch)
+                    loss = self.criterion(outputs, y_batch)
+                    total_loss += loss.item() * len(X_batch)
+                    
+                    # Calculate accuracy
+                    predictions = (outputs >= 0.5).float()
+                    correct += (predictions == y_batch).sum().item()
+                    total += len(y_batch)
         
         avg_loss = total_loss / total
         accuracy = correct / total
@@ -114,6 +158,18 @@ class HeartDiseaseClient(fl.client.NumPyClient):
         )
 
 
-def create_client(model, X_train, y_train, X_test, y_test):
+def create_client(
+    model,
+    X_train,
+    y_train,
+    X_test,
+    y_test,
+    precision=TRAINING_PRECISION,
+    keep_optimizer_state=KEEP_OPTIMIZER_STATE
+):
     """Factory function to create a client."""
-    return HeartDiseaseClient(model, X_train, y_train, X_test, y_test)
\ No newline at end of file
+    return HeartDiseaseClient(
+        model, X_train, y_train, X_test, y_test,
+        precision=precision,
+        keep_optimizer_state=keep_optimizer_state
+    )
\ No newline at end of file
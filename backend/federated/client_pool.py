@@ -0,0 +1,95 @@
+"""Pool of long-lived clients reused across federated rounds."""
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+from config import CLIENT_POOL_SIZE
+
+
+class ClientPool:
+    """
+    Keeps per-hospital client objects alive for the whole run.
+
+    Flower calls ``client_fn`` every round; serving it from this pool
+    keeps the model, tensors, data loaders and optimizer of each client
+    instead of rebuilding them. The pool lives in the process executing
+    the clients (each simulation worker has its own) and evicts the
+    least recently used clients beyond ``max_clients``.
+
+    Flower hands a client id to whichever worker is free, so under Ray
+    several workers may hold their own copy of the same hospital. Pooled
+    clients therefore only carry optimizer state across rounds in the
+    in-process (pipelined) path, where each id maps to a single client.
+    """
+
+    def __init__(self, max_clients: int = CLIENT_POOL_SIZE):
+        """Initialize the pool."""
+        self.max_clients = max_clients
+        self._clients = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, run_id: str, cid: Hashable, factory: Callable):
+        """
+        Return the pooled client for a run, creating it if needed.
+
+        Args:
+            run_id: Identifier of the current simulation run
+            cid: Client identifier
+            factory: Callable building the client on a miss
+
+        Returns:
+            Client instance
+        """
+        key = (run_id, cid)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                self._clients.move_to_end(key)
+                return client
+
+        # Build outside the lock; clients of other workers are not blocked
+        client = factory()
+
+        with self._lock:
+            # Clients of finished runs hold stale data and are never reused
+            for stale_key in [k for k in self._clients if k[0] != run_id]:
+                del self._clients[stale_key]
+
+            client = self._clients.setdefault(key, client)
+            self._clients.move_to_end(key)
+            while len(self._clients) > self.max_clients:
+                self._clients.popitem(last=False)
+        return client
+
+    def release(self, run_id: str):
+        """Drop the clients of a finished run."""
+        with self._lock:
+            for key in [k for k in self._clients if k[0] == run_id]:
+                del self._clients[key]
+
+    def clear(self):
+        """Drop all pooled clients."""
+        with self._lock:
+            self._clients.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._clients)
+
+
+# Per-process client pool
+client_pool = ClientPool()
+
+
+def get_pooled_client(run_id: str, cid: Hashable, factory: Callable):
+    """
+    Return a client from the pool of the calling process.
+
+    Client functions shipped to simulation workers must call this instead
+    of referencing ``client_pool``: cloudpickle serializes a closure's
+    globals by value (and the pool's lock cannot be pickled), while a
+    module-level function is pickled by reference and resolved in the
+    worker, against that worker's own pool.
+    """
+    return client_pool.get(run_id, cid, factory)
@@ -0,0 +1,93 @@
+"""Local fine-tuning of per-hospital output heads on top of the global model."""
+
+from typing import Dict, Tuple
+
+import numpy as np
+import torch
+import torch.nn as nn
+
+from models.heart_model import HeartDiseaseModel
+from models.personalized import PersonalizedModelStore
+from data.dataset import generate_heart_disease_data
+from config import (
+    NUM_CLIENTS,
+    SAMPLES_PER_CLIENT,
+    BATCH_SIZE,
+    PERSONALIZATION_EPOCHS,
+    PERSONALIZATION_LR
+)
+
+
+def fine_tune_head(
+    model: HeartDiseaseModel,
+    X_train: np.ndarray,
+    y_train: np.ndarray,
+    epochs: int = PERSONALIZATION_EPOCHS,
+    lr: float = PERSONALIZATION_LR
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Fine-tune a copy of the output head on local data with the body frozen.
+
+    Because the body is frozen, its hidden features are computed once and
+    only the small head is trained.
+
+    Args:
+        model: Global model (left unchanged)
+        X_train, y_train: Local training data
+        epochs: Fine-tuning epochs
+        lr: Learning rate
+
+    Returns:
+        weight_delta, bias_delta: Fine-tuned head minus global head
+    """
+    model.eval()
+    with torch.no_grad():
+        hidden = model.features(torch.FloatTensor(X_train))
+    targets = torch.FloatTensor(y_train).reshape(-1, 1)
+
+    head = nn.Linear(model.fc4.in_features, 1)
+    head.load_state_dict(model.fc4.state_dict())
+    optimizer = torch.optim.Adam(head.parameters(), lr=lr)
+    criterion = nn.BCEWithLogitsLoss()
+
+    for _ in range(epochs):
+        permutation = torch.randperm(len(hidden))
+        for start in range(0, len(hidden), BATCH_SIZE):
+            batch = permutation[start:start + BATCH_SIZE]
+            optimizer.zero_grad()
+            loss = criterion(head(hidden[batch]), targets[batch])
+            loss.backward()
+            optimizer.step()
+
+    with torch.no_grad():
+        weight_delta = (head.weight - model.fc4.weight).numpy()
+        bias_delta = (head.bias - model.fc4.bias).numpy()
+    return weight_delta, bias_delta
+
+
+def personalize_hospitals(
+    model: HeartDiseaseModel,
+    model_version: str,
+    normalization: Dict,
+    store: PersonalizedModelStore
+):
+    """
+    Fine-tune and store a personalized head for every hospital.
+
+    Hospital ids are 1-based (client id + 1), matching the /api/hospital
+    routes.
+
+    Args:
+        model: Published global model
+        model_version: Version the deltas apply to
+        normalization: Normalization statistics of the global model
+        store: Store receiving the deltas
+    """
+    for client_id in range(NUM_CLIENTS):
+        X_train, _, y_train, _ = generate_heart_disease_data(
+            num_samples=SAMPLES_PER_CLIENT,
+            client_id=client_id,
+            normalization=normalization
+        )
+        weight_delta, bias_delta = fine_tune_head(model, X_train, y_train)
+        store.save_delta(model_version, client_id + 1, weight_delta, bias_delta)
@@ -0,0 +1,120 @@
+"""Pipelined round scheduler overlapping evaluation with the next local fit."""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from flwr.server.strategy.aggregate import weighted_loss_avg
+
+from federated.client import HeartDiseaseClient
+from federated.server import HeartDiseaseStrategy
+
+
+class PipelinedRoundScheduler:
+    """
+    Runs federated rounds in-process, overlapping phases across rounds.
+
+    As soon as round r's aggregate exists, every client starts round
+    r+1's local fit with it, while round r is evaluated on a separate
+    worker pool. Evaluations are reconciled strictly in round order, so
+    history, checkpoints and progress callbacks see the same sequence as
+    with the sequential Flower loop. Training itself is unchanged: round
+    r+1 always starts from round r's aggregate.
+    """
+
+    def __init__(
+        self,
+        clients: Dict[str, HeartDiseaseClient],
+        strategy: HeartDiseaseStrategy,
+        fit_workers: int,
+        eval_workers: int = 1
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            clients: Long-lived clients keyed by client id
+            strategy: Strategy used for aggregation and round bookkeeping
+            fit_workers: Clients training concurrently
+            eval_workers: Clients evaluating concurrently
+        """
+        self.clients = clients
+        self.strategy = strategy
+        self.fit_workers = fit_workers
+        self.eval_workers = eval_workers
+
+    def _submit_fits(self, pool: ThreadPoolExecutor, server_round: int, parameters: List[np.ndarray]) -> List[Future]:
+        config = self.strategy.fit_config(server_round)
+        return [pool.submit(client.fit, parameters, config) for client in self.clients.values()]
+
+    def _submit_evaluations(self, pool: ThreadPoolExecutor, parameters: List[np.ndarray]) -> List[Future]:
+        return [pool.submit(client.evaluate, parameters, {}) for client in self.clients.values()]
+
+    def _reconcile(self, server_round: int, futures: List[Future], parameters, state: Dict):
+        """Aggregate one round's evaluations and hand them to the strategy."""
+        results = [future.result() for future in futures]
+
+        loss = weighted_loss_avg([(num_examples, loss) for loss, num_examples, _ in results])
+        metrics = {}
+        if self.strategy.evaluate_metrics_aggregation_fn is not None:
+            metrics = self.strategy.evaluate_metrics_aggregation_fn(
+                [(num_examples, client_metrics) for _, num_examples, client_metrics in results]
+            )
+
+        self.strategy.complete_round(server_round, loss, metrics, parameters, state=state)
+
+    def run(self, num_rounds: int, initial_parameters: Optional[List[np.ndarray]] = None) -> List[np.ndarray]:
+        """
+        Run the rounds.
+
+        Args:
+            num_rounds: Number of rounds to run
+            initial_parameters: Global parameters to start from
+                (taken from the first client's model if None)
+
+        Returns:
+            Final global parameters
+        """
+        parameters = initial_parameters
+        if parameters is None:
+            # Copy: these arrays share memory with client 0's model, which
+            # trains in place while other clients read them
+            parameters = [array.copy() for array in next(iter(self.clients.values())).get_parameters({})]
+        if self.strategy.latest_parameters is None:
+            # Server optimizers step from the model the clients started with
+            self.strategy.latest_parameters = parameters
+
+        # (round, evaluation futures, evaluated parameters, strategy state)
+        pending: List[Tuple[int, List[Future], List[np.ndarray], Dict]] = []
+
+        with ThreadPoolExecutor(max_workers=self.fit_workers) as fit_pool, \
+                ThreadPoolExecutor(max_workers=self.eval_workers) as eval_pool:
+            fit_futures = self._submit_fits(fit_pool, 1, parameters)
+
+            for server_round in range(1, num_rounds + 1):
+                updates = []
+                for future in fit_futures:
+                    client_parameters, num_examples, _ = future.result()
+                    updates.append((client_parameters, num_examples))
+                parameters = self.strategy.aggregate_updates(server_round, updates)
+                state = self.strategy.get_state()
+
+                # Next round's training starts before this round is evaluated
+                if server_round < num_rounds:
+                    fit_futures = self._submit_fits(fit_pool, server_round + 1, parameters)
+
+                pending.append((
+                    server_round,
+                    self._submit_evaluations(eval_pool, parameters),
+                    parameters,
+                    state
+                ))
+
+                # Report earlier rounds in order while the new fit runs
+                while len(pending) > 1:
+                    self._reconcile(*pending.pop(0))
+
+            while pending:
+                self._reconcile(*pending.pop(0))
+
+        return parameters
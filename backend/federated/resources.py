@@ -0,0 +1,107 @@
+"""CPU-topology-aware planning of client concurrency and thread counts."""
+
+import math
+import os
+from typing import Dict, Optional
+
+import torch
+
+from config import NUM_CLIENTS, SERVING_RESERVED_CPUS
+
+CGROUP_V2_CPU_MAX = "/sys/fs/cgroup/cpu.max"
+CGROUP_V1_QUOTA = "/sys/fs/cgroup/cpu/cpu.cfs_quota_us"
+CGROUP_V1_PERIOD = "/sys/fs/cgroup/cpu/cpu.cfs_period_us"
+
+
+def _read(path: str) -> Optional[str]:
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def detect_cgroup_cpu_limit() -> Optional[float]:
+    """
+    Read the container CPU quota from cgroups.
+
+    Returns:
+        Number of CPUs allowed by the quota, or None if unlimited
+    """
+    cpu_max = _read(CGROUP_V2_CPU_MAX)
+    if cpu_max:
+        quota, _, period = cpu_max.partition(" ")
+        if quota != "max" and period:
+            return int(quota) / int(period)
+        return None
+
+    quota = _read(CGROUP_V1_QUOTA)
+    period = _read(CGROUP_V1_PERIOD)
+    if quota and period and int(quota) > 0:
+        return int(quota) / int(period)
+    return None
+
+
+def available_cpus() -> int:
+    """Return the number of cores this process may actually use."""
+    if hasattr(os, "sched_getaffinity"):
+        cpus = len(os.sched_getaffinity(0))
+    else:
+        cpus = os.cpu_count() or 1
+
+    limit = detect_cgroup_cpu_limit()
+    if limit is not None:
+        # A fractional quota cannot sustain an extra busy thread
+        cpus = min(cpus, max(1, math.floor(limit)))
+    return cpus
+
+
+def plan_client_resources(num_clients: int = NUM_CLIENTS, reserve_for_serving: bool = False) -> Dict:
+    """
+    Decide how many clients train concurrently and how many threads each gets.
+
+    Args:
+        num_clients: Number of federated clients
+        reserve_for_serving: Keep cores free for API request handling
+
+    Returns:
+        Dictionary with the plan (all counts are whole cores)
+    """
+    total_cpus = available_cpus()
+    reserved = min(SERVING_RESERVED_CPUS, total_cpus - 1) if reserve_for_serving else 0
+    training_cpus = max(1, total_cpus - reserved)
+
+    concurrent_clients = max(1, min(num_clients, training_cpus))
+    threads_per_client = max(1, training_cpus // concurrent_clients)
+
+    return {
+        "total_cpus": total_cpus,
+        "reserved_for_serving": reserved,
+        "training_cpus": concurrent_clients * threads_per_client,
+        "concurrent_clients": concurrent_clients,
+        "threads_per_client": threads_per_client
+    }
+
+
+_interop_threads_set = False
+
+
+def apply_thread_plan(plan: Dict):
+    """
+    Pin torch's thread pools in a simulation worker process to the planned size.
+
+    Both settings are process-wide, so this must only run in dedicated
+    worker processes, never in the API process.
+    """
+    global _interop_threads_set
+    torch.set_num_threads(plan["threads_per_client"])
+    # set_num_interop_threads raises RuntimeError once it has been set, or
+    # once inter-op parallel work has already run in this process. Workers
+    # call this for every client they create, so set it at most once and
+    # keep the existing pool if it is too late
+    if not _interop_threads_set:
+        _interop_threads_set = True
+        try:
+            torch.set_num_interop_threads(1)
+        except RuntimeError:
+            pass
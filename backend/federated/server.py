@@ -1,10 +1,23 @@
 """Flower server strategy for federated learning."""
 
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 import flwr as fl
 from flwr.common import Metrics
 import numpy as np
 
+from federated.aggregation import AggregationEngine
+from federated.server_optim import ServerOptimizer
+from config import NUM_ROUNDS, AGGREGATION_RULE, FEDERATED_STRATEGY, SERVER_LEARNING_RATE, PROXIMAL_MU
+
+# Strategy name -> (server optimizer, client proximal term weight)
+STRATEGIES = {
+    "fedavg": (None, 0.0),
+    "fedavgm": ("fedavgm", 0.0),
+    "fedadam": ("fedadam", 0.0),
+    "fedyogi": ("fedyogi", 0.0),
+    "fedprox": (None, PROXIMAL_MU),
+}
+
 
 def weighted_average(metrics: List[Tuple[int, Metrics]]) -> Metrics:
     """Aggregate metrics using weighted average."""
@@ -16,14 +29,196 @@ def weighted_average(metrics: List[Tuple[int, Metrics]]) -> Metrics:
     return {"accuracy": sum(accuracies) / sum(examples)}
 
 
-def get_federated_strategy():
-    """Create and configure the federated averaging strategy."""
-    strategy = fl.server.strategy.FedAvg(
+class HeartDiseaseStrategy(fl.server.strategy.FedAvg):
+    """
+    FedAvg-based strategy that tracks the global model and checkpoints every round.
+    
+    Optionally steps the global model with a server optimizer (FedAvgM,
+    FedAdam, FedYogi) and asks clients for a proximal term (FedProx).
+    """
+    
+    def __init__(
+        self,
+        *args,
+        num_rounds: int = NUM_ROUNDS,
+        round_offset: int = 0,
+        history: Optional[List[Dict]] = None,
+        checkpoint_store=None,
+        on_round_end: Optional[Callable[[Dict], None]] = None,
+        aggregation_rule: str = AGGREGATION_RULE,
+        strategy_name: str = FEDERATED_STRATEGY,
+        server_learning_rate: Optional[float] = SERVER_LEARNING_RATE,
+        **kwargs
+    ):
+        """
+        Initialize the strategy.
+        
+        Args:
+            num_rounds: Total rounds of the run, including resumed ones
+            round_offset: Rounds already completed before this simulation
+            history: Round metrics of the already completed rounds
+            checkpoint_store: Optional CheckpointStore written after every round
+            on_round_end: Optional callback receiving each round's metrics
+            aggregation_rule: Rule used by the AggregationEngine
+            strategy_name: One of STRATEGIES
+            server_learning_rate: Server optimizer step size (optimizer
+                default if None)
+            *args, **kwargs: Passed through to FedAvg
+        """
+        if strategy_name not in STRATEGIES:
+            raise ValueError(f"Unknown federated strategy: {strategy_name}")
+        server_optimizer, self.proximal_mu = STRATEGIES[strategy_name]
+        self.strategy_name = strategy_name
+        self.server_optimizer = (
+            ServerOptimizer(server_optimizer, learning_rate=server_learning_rate)
+            if server_optimizer is not None else None
+        )
+        
+        kwargs.setdefault("on_fit_config_fn", self.fit_config)
+        super().__init__(*args, **kwargs)
+        self.latest_parameters: Optional[List[np.ndarray]] = None
+        self.num_rounds = num_rounds
+        self.round_offset = round_offset
+        self.round_history = list(history or [])
+        self.checkpoint_store = checkpoint_store
+        self.on_round_end = on_round_end
+        self.engine = AggregationEngine(rule=aggregation_rule)
+    
+    def get_state(self) -> Dict:
+        """Return strategy state that must survive a restart."""
+        arrays = self.server_optimizer.get_state() if self.server_optimizer is not None else {}
+        return {"arrays": arrays, "scalars": {"strategy": self.strategy_name}}
+    
+    def set_state(self, state: Dict):
+        """Restore strategy state saved by get_state."""
+        saved_strategy = state.get("scalars", {}).get("strategy", "fedavg")
+        if saved_strategy != self.strategy_name:
+            raise ValueError(
+                f"Checkpoint was trained with {saved_strategy}, not {self.strategy_name}"
+            )
+        if self.server_optimizer is not None:
+            self.server_optimizer.set_state(state.get("arrays", {}))
+    
+    def fit_config(self, server_round: int) -> Dict:
+        """Config sent to every client's fit call."""
+        return {"proximal_mu": self.proximal_mu}
+    
+    def configure_fit(self, server_round, parameters, client_manager):
+        """Remember the starting global model when Flower picked it from a client."""
+        if self.latest_parameters is None:
+            self.latest_parameters = fl.common.parameters_to_ndarrays(parameters)
+        return super().configure_fit(server_round, parameters, client_manager)
+    
+    def aggregate_updates(
+        self,
+        server_round: int,
+        updates: List[Tuple[List[np.ndarray], int]]
+    ) -> List[np.ndarray]:
+        """
+        Aggregate (parameters, num_examples) client updates into the new global model.
+        
+        Args:
+            server_round: Current round
+            updates: Parameters and training set size of each client
+        
+        Returns:
+            New global parameters
+        """
+        aggregated = self.engine.aggregate(
+            [parameters for parameters, _ in updates],
+            [num_examples for _, num_examples in updates],
+            reference=self.latest_parameters
+        )
+        if self.server_optimizer is not None and self.latest_parameters is not None:
+            aggregated = self.server_optimizer.step(self.latest_parameters, aggregated)
+        self.latest_parameters = aggregated
+        return aggregated
+    
+    def aggregate_fit(self, server_round, results, failures):
+        """Aggregate client updates and remember the resulting global model."""
+        if not results:
+            return None, {}
+        if not self.accept_failures and failures:
+            return None, {}
+        
+        updates = [
+            (fl.common.parameters_to_ndarrays(fit_res.parameters), fit_res.num_examples)
+            for _, fit_res in results
+        ]
+        aggregated = self.aggregate_updates(server_round, updates)
+        
+        metrics = {}
+        if self.fit_metrics_aggregation_fn is not None:
+            metrics = self.fit_metrics_aggregation_fn(
+                [(fit_res.num_examples, fit_res.metrics) for _, fit_res in results]
+            )
+        
+        return fl.common.ndarrays_to_parameters(aggregated), metrics
+    
+    def aggregate_evaluate(self, server_round, results, failures):
+        """Aggregate evaluation results, then record and checkpoint the round."""
+        loss, metrics = super().aggregate_evaluate(server_round, results, failures)
+        self.complete_round(server_round, loss, metrics, self.latest_parameters)
+        return loss, metrics
+    
+    def complete_round(
+        self,
+        server_round: int,
+        loss: Optional[float],
+        metrics: Dict,
+        parameters: Optional[List[np.ndarray]],
+        state: Optional[Dict] = None
+    ):
+        """
+        Record, checkpoint and report a finished round.
+        
+        Args:
+            server_round: Round number within this simulation
+            loss: Aggregated evaluation loss
+            metrics: Aggregated evaluation metrics
+            parameters: Global parameters that were evaluated in this round
+            state: Strategy state right after this round's aggregation
+                (defaults to the current state)
+        """
+        # Flower numbers rounds from 1 in every simulation, even when resuming
+        global_round = self.round_offset + server_round
+        record = {
+            "round": global_round,
+            "accuracy": metrics.get("accuracy"),
+            "loss": loss
+        }
+        self.round_history.append(record)
+        
+        if self.checkpoint_store is not None and parameters is not None:
+            self.checkpoint_store.save_round(
+                global_round,
+                self.num_rounds,
+                parameters,
+                state if state is not None else self.get_state(),
+                self.round_history
+            )
+        
+        if self.on_round_end is not None:
+            self.on_round_end(record)
+
+
+def get_federated_strategy(**kwargs):
+    """
+    Create and configure the federated strategy.
+    
+    Args:
+        **kwargs: Options forwarded to HeartDiseaseStrategy
+            (initial_parameters, num_rounds, round_offset, history,
+            checkpoint_store, on_round_end, aggregation_rule,
+            strategy_name, server_learning_rate)
+    """
+    strategy = HeartDiseaseStrategy(
         fraction_fit=1.0,  # Use all available clients for training
         fraction_evaluate=1.0,  # Use all available clients for evaluation
         min_fit_clients=3,  # Minimum number of clients for training
         min_evaluate_clients=3,  # Minimum number of clients for evaluation
         min_available_clients=3,  # Wait until all 3 clients are available
         evaluate_metrics_aggregation_fn=weighted_average,  # Aggregate metrics
+        **kwargs
     )
     return strategy
@@ -0,0 +1,123 @@
+"""Server-side optimizers applied to the aggregated client update."""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from config import SERVER_MOMENTUM, SERVER_BETA2, SERVER_ADAPTIVITY
+
+SERVER_OPTIMIZERS = ("fedavgm", "fedadam", "fedyogi")
+
+# Server learning rates used when none is configured. At steady state
+# FedAvgM steps lr / (1 - momentum) times the averaged update; lr 1.0 with
+# momentum 0.9 (10x) has diverged on this model, so the default keeps the
+# effective step at ~3x FedAvg. Re-check with python -m federated.benchmark
+# after changing the model or data.
+DEFAULT_SERVER_LEARNING_RATES = {
+    "fedavgm": 0.3,
+    "fedadam": 0.01,
+    "fedyogi": 0.01,
+}
+
+
+class ServerOptimizer:
+    """
+    Treats the aggregated update as a pseudo-gradient and steps the global model.
+
+    With delta = aggregate - global, each round computes
+
+        fedavgm:  m = momentum * m + delta
+                  global += lr * m
+        fedadam:  m = momentum * m + (1 - momentum) * delta
+                  v = beta2 * v + (1 - beta2) * delta^2
+                  global += lr * m / (sqrt(v) + adaptivity)
+        fedyogi:  as fedadam, but v -= (1 - beta2) * delta^2 * sign(v - delta^2)
+
+    Moments are flat float32 vectors over all parameters and are part of
+    the strategy state, so resumed runs continue with the same momentum.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        learning_rate: Optional[float] = None,
+        momentum: float = SERVER_MOMENTUM,
+        beta2: float = SERVER_BETA2,
+        adaptivity: float = SERVER_ADAPTIVITY
+    ):
+        """
+        Initialize the optimizer.
+
+        Args:
+            name: One of "fedavgm", "fedadam", "fedyogi"
+            learning_rate: Server learning rate (optimizer default if None)
+            momentum: Server momentum (first moment decay for fedadam/fedyogi)
+            beta2: Second moment decay (fedadam, fedyogi)
+            adaptivity: Added to sqrt(v); also the initial sqrt(v)
+        """
+        if name not in SERVER_OPTIMIZERS:
+            raise ValueError(f"Unknown server optimizer: {name}")
+
+        self.name = name
+        self.learning_rate = (
+            learning_rate if learning_rate is not None else DEFAULT_SERVER_LEARNING_RATES[name]
+        )
+        self.momentum = momentum
+        self.beta2 = beta2
+        self.adaptivity = adaptivity
+
+        self.m: Optional[np.ndarray] = None
+        self.v: Optional[np.ndarray] = None
+
+    def step(self, current: List[np.ndarray], aggregated: List[np.ndarray]) -> List[np.ndarray]:
+        """
+        Apply one server step.
+
+        Args:
+            current: Global parameters the clients started from
+            aggregated: Aggregated client parameters
+
+        Returns:
+            New global parameters
+        """
+        shapes = [array.shape for array in current]
+        x = np.concatenate([array.ravel() for array in current]).astype(np.float32)
+        delta = np.concatenate([array.ravel() for array in aggregated]).astype(np.float32) - x
+
+        if self.m is None or self.m.shape != x.shape:
+            self.m = np.zeros_like(x)
+            self.v = np.full_like(x, self.adaptivity ** 2)
+
+        if self.name == "fedavgm":
+            self.m *= self.momentum
+            self.m += delta
+            x += self.learning_rate * self.m
+        else:
+            self.m *= self.momentum
+            self.m += (1 - self.momentum) * delta
+            delta_sq = np.square(delta)
+            if self.name == "fedadam":
+                self.v *= self.beta2
+                self.v += (1 - self.beta2) * delta_sq
+            else:
+                self.v -= (1 - self.beta2) * delta_sq * np.sign(self.v - delta_sq)
+            x += self.learning_rate * self.m / (np.sqrt(self.v) + self.adaptivity)
+
+        arrays, offset = [], 0
+        for shape in shapes:
+            size = int(np.prod(shape))
+            arrays.append(x[offset:offset + size].reshape(shape))
+            offset += size
+        return arrays
+
+    def get_state(self) -> Dict:
+        """Return copies of the moments (they are updated in place every round)."""
+        if self.m is None:
+            return {}
+        return {"server_m": self.m.copy(), "server_v": self.v.copy()}
+
+    def set_state(self, arrays: Dict):
+        """Restore moments saved by get_state."""
+        if "server_m" in arrays and "server_v" in arrays:
+            self.m = np.array(arrays["server_m"], dtype=np.float32)
+            self.v = np.array(arrays["server_v"], dtype=np.float32)
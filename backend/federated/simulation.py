@@ -1,22 +1,72 @@
 """Federated learning simulation orchestrator."""
 
+import uuid
 import flwr as fl
-from typing import Callable, Dict, List
+from typing import Callable, Dict, List, Optional
+import numpy as np
 import torch
 
 from models.heart_model import HeartDiseaseModel
-from data.dataset import generate_heart_disease_data
+from data.dataset import generate_heart_disease_data, generate_new_batch
+from data.encoder import compute_feature_statistics, aggregate_feature_statistics
 from federated.client import create_client
+from federated.client_pool import client_pool, get_pooled_client
+from federated.pipeline import PipelinedRoundScheduler
 from federated.server import get_federated_strategy
-from config import NUM_CLIENTS, NUM_ROUNDS, SAMPLES_PER_CLIENT
+from federated.resources import plan_client_resources, apply_thread_plan
+from config import (
+    NUM_CLIENTS,
+    NUM_ROUNDS,
+    SAMPLES_PER_CLIENT,
+    CONTINUAL_BATCH_SIZE,
+    PIPELINED_ROUNDS,
+    FEDERATED_STRATEGY,
+    KEEP_OPTIMIZER_STATE
+)
 
 
-def create_client_fn(client_id: int) -> Callable:
+def compute_global_normalization() -> Dict:
+    """
+    Aggregate per-hospital feature statistics into global normalization statistics.
+    
+    Each hospital only shares counts, sums and sums of squares of its raw
+    training features.
+    
+    Returns:
+        Dictionary with global count, mean and std
+    """
+    client_statistics = []
+    for client_id in range(NUM_CLIENTS):
+        X_train, _, _, _ = generate_heart_disease_data(
+            num_samples=SAMPLES_PER_CLIENT,
+            client_id=client_id,
+            normalize=False
+        )
+        client_statistics.append(compute_feature_statistics(X_train))
+    return aggregate_feature_statistics(client_statistics)
+
+
+def create_client_fn(
+    client_id: int,
+    resource_plan: Optional[Dict],
+    run_id: str,
+    normalization: Dict,
+    batch_index: Optional[int] = None,
+    keep_optimizer_state: bool = False
+) -> Callable:
     """
     Create a client function for Flower simulation.
     
     Args:
         client_id: Unique identifier for the client
+        resource_plan: Thread plan applied in the worker process running
+            the client (None when clients run in the API process)
+        run_id: Identifier of the simulation run (scopes the client pool)
+        normalization: Global normalization statistics
+        batch_index: If set, train only on this newly arrived batch
+            (continual learning); evaluation still uses the held-out split
+        keep_optimizer_state: Carry optimizer moments across rounds; only
+            consistent when this client id always runs on the same client
     
     Returns:
         Callable that creates a client instance
@@ -24,55 +74,196 @@ def create_client_fn(client_id: int) -> Callable:
     # Generate data for this client
     X_train, X_test, y_train, y_test = generate_heart_disease_data(
         num_samples=SAMPLES_PER_CLIENT,
-        client_id=client_id
+        client_id=client_id,
+        normalization=normalization
     )
     
+    if batch_index is not None:
+        X_train, y_train = generate_new_batch(
+            client_id=client_id,
+            batch_size=CONTINUAL_BATCH_SIZE,
+            batch_index=batch_index,
+            normalization=normalization
+        )
+    
     def client_fn(cid: str):
-        """Create a client instance."""
-        # Create a fresh model for this client
-        model = HeartDiseaseModel()
-        return create_client(model, X_train, y_train, X_test, y_test)
+        """Return this worker's long-lived client instance."""
+        if resource_plan is not None:
+            apply_thread_plan(resource_plan)
+        
+        return get_pooled_client(
+            run_id,
+            cid,
+            lambda: create_client(
+                HeartDiseaseModel(), X_train, y_train, X_test, y_test,
+                keep_optimizer_state=keep_optimizer_state
+            )
+        )
     
     return client_fn
 
 
-def run_federated_simulation() -> Dict:
+def simulation_client_fn(client_fns: Dict[str, Callable]) -> Callable:
+    """Build the client_fn handed to Flower (pickled and sent to every Ray worker)."""
+    return lambda cid: client_fns[cid](cid)
+
+
+def run_federated_simulation(
+    reserve_for_serving: bool = False,
+    num_rounds: int = NUM_ROUNDS,
+    initial_parameters: Optional[List[np.ndarray]] = None,
+    round_offset: int = 0,
+    completed_history: Optional[List[Dict]] = None,
+    strategy_state: Optional[Dict] = None,
+    checkpoint_store=None,
+    on_round_end: Optional[Callable[[Dict], None]] = None,
+    batch_index: Optional[int] = None,
+    normalization: Optional[Dict] = None,
+    pipelined: bool = PIPELINED_ROUNDS,
+    strategy_name: str = FEDERATED_STRATEGY
+) -> Dict:
     """
     Run the federated learning simulation.
     
+    Args:
+        reserve_for_serving: Keep cores free for the API process
+        num_rounds: Total rounds of the run, including already completed ones
+        initial_parameters: Global parameters to start from (random if None)
+        round_offset: Rounds already completed (when resuming)
+        completed_history: Round metrics of the already completed rounds
+        strategy_state: Strategy state saved with the resumed checkpoint
+        checkpoint_store: Optional CheckpointStore written after every round
+        on_round_end: Optional callback receiving each round's metrics
+        batch_index: Train on this newly arrived batch only (continual learning)
+        normalization: Global normalization statistics to train with
+            (computed federatedly if None; pass the served model's
+            statistics when continuing from it)
+        pipelined: Run rounds in-process with the pipelined scheduler
+            instead of Flower's sequential simulation loop
+        strategy_name: Federated strategy (see federated.server.STRATEGIES)
+    
     Returns:
         Dictionary containing training history and metrics
     """
+    # Size client concurrency and per-client threads to the real CPU budget
+    resource_plan = plan_client_resources(NUM_CLIENTS, reserve_for_serving)
+    
+    if normalization is None:
+        normalization = compute_global_normalization()
+    
     # Create client functions for all clients
+    run_id = uuid.uuid4().hex
+    # In-process clients share the API's torch thread pools; only the plan's
+    # concurrency applies to them
+    worker_plan = None if pipelined else resource_plan
+    # Under Ray a client id may run on a different worker (with its own pooled
+    # copy) every round, so optimizer moments would come from a stale round
+    keep_optimizer_state = KEEP_OPTIMIZER_STATE and pipelined
     client_fns = {
-        str(i): create_client_fn(i) for i in range(NUM_CLIENTS)
+        str(i): create_client_fn(
+            i, worker_plan, run_id, normalization, batch_index, keep_optimizer_state
+        )
+        for i in range(NUM_CLIENTS)
     }
     
     # Get strategy
-    strategy = get_federated_strategy()
+    strategy = get_federated_strategy(
+        initial_parameters=(
+            fl.common.ndarrays_to_parameters(initial_parameters)
+            if initial_parameters is not None else None
+        ),
+        num_rounds=num_rounds,
+        round_offset=round_offset,
+        history=completed_history,
+        checkpoint_store=checkpoint_store,
+        on_round_end=on_round_end,
+        strategy_name=strategy_name,
+    )
+    strategy.latest_parameters = initial_parameters
+    if strategy_state is not None:
+        strategy.set_state(strategy_state)
+    
+    if pipelined:
+        try:
+            return _run_pipelined(
+                client_fns, strategy, resource_plan, normalization,
+                num_rounds, round_offset, initial_parameters
+            )
+        finally:
+            # Pipelined clients live in this (API) process; free their models,
+            # tensors and optimizers now rather than at the next run
+            client_pool.release(run_id)
     
     # Run simulation
     history = fl.simulation.start_simulation(
-        client_fn=lambda cid: client_fns[cid](cid),
+        client_fn=simulation_client_fn(client_fns),
         num_clients=NUM_CLIENTS,
-        config=fl.server.ServerConfig(num_rounds=NUM_ROUNDS),
+        config=fl.server.ServerConfig(num_rounds=num_rounds - round_offset),
         strategy=strategy,
-        client_resources={"num_cpus": 1, "num_gpus": 0},
+        client_resources={"num_cpus": resource_plan["threads_per_client"], "num_gpus": 0},
+        ray_init_args={
+            "num_cpus": resource_plan["training_cpus"],
+            "include_dashboard": False,
+            "ignore_reinit_error": True,
+        },
     )
     
     # Extract metrics
     metrics = {
-        "rounds": NUM_ROUNDS,
+        "rounds": num_rounds,
         "num_clients": NUM_CLIENTS,
         "distributed_losses": history.losses_distributed,
         "distributed_metrics": history.metrics_distributed,
         "centralized_losses": history.losses_centralized,
         "centralized_metrics": history.metrics_centralized,
+        "parameters": strategy.latest_parameters,
+        "round_history": strategy.round_history,
+        "resources": resource_plan,
+        "normalization": normalization,
+        "strategy": strategy_name,
     }
     
     return metrics
 
 
+def _run_pipelined(
+    client_fns: Dict[str, Callable],
+    strategy,
+    resource_plan: Dict,
+    normalization: Dict,
+    num_rounds: int,
+    round_offset: int,
+    initial_parameters: Optional[List[np.ndarray]]
+) -> Dict:
+    """Run the remaining rounds with the in-process pipelined scheduler."""
+    clients = {cid: client_fn(cid) for cid, client_fn in client_fns.items()}
+    # Evaluation overlaps fitting, so both pools share the planned concurrency
+    concurrent = resource_plan["concurrent_clients"]
+    eval_workers = max(1, concurrent // 3)
+    scheduler = PipelinedRoundScheduler(
+        clients,
+        strategy,
+        fit_workers=max(1, concurrent - eval_workers),
+        eval_workers=eval_workers
+    )
+    scheduler.run(num_rounds - round_offset, initial_parameters)
+    
+    new_rounds = strategy.round_history[len(strategy.round_history) - (num_rounds - round_offset):]
+    return {
+        "rounds": num_rounds,
+        "num_clients": NUM_CLIENTS,
+        "distributed_losses": [(r["round"], r["loss"]) for r in new_rounds],
+        "distributed_metrics": {"accuracy": [(r["round"], r["accuracy"]) for r in new_rounds]},
+        "centralized_losses": [],
+        "centralized_metrics": {},
+        "parameters": strategy.latest_parameters,
+        "round_history": strategy.round_history,
+        "resources": resource_plan,
+        "normalization": normalization,
+        "strategy": strategy.strategy_name,
+    }
+
+
 def extract_training_history(simulation_results: Dict) -> List[Dict]:
     """
     Extract clean training history for frontend display.
@@ -83,6 +274,17 @@ def extract_training_history(simulation_results: Dict) -> List[Dict]:
     Returns:
         List of round metrics
     """
+    # Rounds recorded by the strategy carry global round numbers and losses
+    if simulation_results.get("round_history"):
+        return [
+            {
+                "round": record["round"],
+                "accuracy": float(record["accuracy"]) if record["accuracy"] is not None else None,
+                "loss": float(record["loss"]) if record["loss"] is not None else None
+            }
+            for record in simulation_results["round_history"]
+        ]
+    
     history = []
     
     # Extract distributed metrics (from all clients)
@@ -0,0 +1,5 @@
+"""Load testing package."""
+
+from .runner import run_load_test, random_patient, summarize_latencies
+
+__all__ = ['run_load_test', 'random_patient', 'summarize_latencies']
@@ -0,0 +1,67 @@
+"""
+Command-line entry point for the load generator.
+
+Examples (run from the backend directory):
+    python -m loadtest --concurrency 20 --requests 2000
+    python -m loadtest --url http://localhost:8000 --duration 60 --with-training
+    python -m loadtest --mix predict=0.9,metrics=0.1 --output report.json
+"""
+
+import argparse
+import asyncio
+import json
+from typing import Dict
+
+from loadtest.runner import run_load_test, DEFAULT_MIX, PAYLOAD_DISTRIBUTIONS
+
+
+def parse_mix(value: str) -> Dict[str, float]:
+    """Parse "predict=0.7,features=0.3" into a mix dictionary."""
+    mix = {}
+    for item in value.split(","):
+        name, _, weight = item.partition("=")
+        mix[name.strip()] = float(weight)
+    return mix
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the heart risk API")
+    parser.add_argument("--url", help="Base URL of a running instance (default: serve the app with uvicorn in a thread)")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--requests", type=int, default=1000, help="Total requests to send")
+    parser.add_argument("--duration", type=float, help="Run for this many seconds instead")
+    parser.add_argument("--mix", type=parse_mix, default=DEFAULT_MIX,
+                        help="Endpoint weights, e.g. predict=0.7,features=0.1")
+    parser.add_argument("--payload", choices=PAYLOAD_DISTRIBUTIONS, default="clinical",
+                        help="Distribution of /predict payloads")
+    parser.add_argument("--with-training", action="store_true",
+                        help="Start a training job and compare latency while it runs")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    args = parser.parse_args()
+
+    app = None
+    if args.url is None:
+        from main import app
+
+    report = asyncio.run(run_load_test(
+        base_url=args.url,
+        app=app,
+        concurrency=args.concurrency,
+        total_requests=args.requests,
+        duration=args.duration,
+        mix=args.mix,
+        payload_distribution=args.payload,
+        with_training=args.with_training,
+        seed=args.seed,
+    ))
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,313 @@
+"""Async HTTP load generator for the FastAPI service."""
+
+import asyncio
+import contextlib
+import random
+import socket
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+import numpy as np
+import uvicorn
+
+from data.dataset import FEATURE_RANGES
+from config import FEATURE_NAMES
+
+# name -> (method, path)
+ENDPOINTS = {
+    "predict": ("POST", "/predict"),
+    "features": ("GET", "/features"),
+    "training_status": ("GET", "/training-status"),
+    "metrics": ("GET", "/metrics"),
+}
+
+DEFAULT_MIX = {
+    "predict": 0.7,
+    "features": 0.1,
+    "training_status": 0.1,
+    "metrics": 0.1,
+}
+
+PAYLOAD_DISTRIBUTIONS = ("clinical", "boundary", "outlier")
+
+LATENCY_PERCENTILES = [50, 90, 95, 99]
+
+TRAINING_POLL_INTERVAL = 0.5  # seconds
+
+SERVER_START_TIMEOUT = 30.0  # seconds
+
+
+def random_patient(rng: random.Random, distribution: str = "clinical") -> Dict[str, float]:
+    """
+    Generate one raw clinical /predict payload.
+
+    Args:
+        rng: Random number generator
+        distribution: "clinical" (values within the training ranges),
+            "boundary" (values at the range edges) or "outlier"
+            (values up to 50% beyond the ranges)
+
+    Returns:
+        Feature dictionary
+    """
+    if distribution not in PAYLOAD_DISTRIBUTIONS:
+        raise ValueError(f"Unknown payload distribution: {distribution}")
+
+    patient = {}
+    for name, (kind, low, high) in zip(FEATURE_NAMES, FEATURE_RANGES):
+        top = high - 1 if kind == "int" else high
+        if distribution == "clinical":
+            value = rng.randint(low, top) if kind == "int" else rng.uniform(low, high)
+        elif distribution == "boundary":
+            value = rng.choice([low, top])
+        else:
+            span = (top - low) * 0.5
+            value = rng.choice([low - rng.uniform(0, span), top + rng.uniform(0, span)])
+        patient[name] = float(value)
+    return patient
+
+
+def summarize_latencies(latencies: List[float]) -> Dict:
+    """Summarize request latencies (seconds) into milliseconds percentiles."""
+    if not latencies:
+        return {"count": 0}
+
+    values = np.asarray(latencies) * 1000.0
+    summary = {
+        "count": int(len(values)),
+        "mean_ms": float(values.mean()),
+        "max_ms": float(values.max()),
+    }
+    for p, value in zip(LATENCY_PERCENTILES, np.percentile(values, LATENCY_PERCENTILES)):
+        summary[f"p{p}_ms"] = float(value)
+    return summary
+
+
+@contextlib.contextmanager
+def serve_in_thread(app, host: str = "127.0.0.1"):
+    """
+    Run an ASGI app with uvicorn in a background thread.
+
+    The server gets its own event loop, so the generator's queueing is not
+    mixed into the measured latency (as it would be with an in-loop
+    ASGI transport).
+
+    Yields:
+        Base URL of the running server
+    """
+    with socket.socket() as sock:
+        sock.bind((host, 0))
+        port = sock.getsockname()[1]
+
+    server = uvicorn.Server(uvicorn.Config(app, host=host, port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    try:
+        deadline = time.monotonic() + SERVER_START_TIMEOUT
+        while not server.started:
+            if not thread.is_alive() or time.monotonic() > deadline:
+                raise RuntimeError("In-process server failed to start")
+            time.sleep(0.05)
+        yield f"http://{host}:{port}"
+    finally:
+        server.should_exit = True
+        thread.join()
+
+
+class _Sample:
+    __slots__ = ("endpoint", "latency", "ok", "training_active")
+
+    def __init__(self, endpoint: str, latency: float, ok: bool, training_active: bool):
+        self.endpoint = endpoint
+        self.latency = latency
+        self.ok = ok
+        self.training_active = training_active
+
+
+def _summarize_samples(samples: List[_Sample], elapsed: float) -> Dict:
+    errors = sum(1 for sample in samples if not sample.ok)
+    return {
+        "requests": len(samples),
+        "throughput_rps": len(samples) / elapsed if elapsed > 0 else 0.0,
+        "error_rate": errors / len(samples) if samples else 0.0,
+        "latency": summarize_latencies([sample.latency for sample in samples]),
+    }
+
+
+def _seconds_in_state(transitions: List[Tuple[float, bool]], start: float, end: float) -> float:
+    """Seconds within [start, end] spent active, given (time, active) state changes."""
+    total = 0.0
+    for (at, active), (next_at, _) in zip(transitions, transitions[1:] + [(end, False)]):
+        if active:
+            total += max(0.0, min(next_at, end) - max(at, start))
+    return total
+
+
+async def run_load_test(
+    base_url: Optional[str] = None,
+    app=None,
+    concurrency: int = 10,
+    total_requests: int = 1000,
+    duration: Optional[float] = None,
+    mix: Optional[Dict[str, float]] = None,
+    payload_distribution: str = "clinical",
+    with_training: bool = False,
+    seed: int = 0,
+    timeout: float = 30.0
+) -> Dict:
+    """
+    Drive the API with concurrent requests and report throughput and latency.
+
+    Args:
+        base_url: URL of a running instance (e.g. http://localhost:8000)
+        app: ASGI app served by uvicorn in a background thread when no
+            base_url is given
+        concurrency: Number of concurrent virtual users
+        total_requests: Stop after this many requests
+        duration: Stop after this many seconds instead, if set
+        mix: Relative weight of each endpoint name in ENDPOINTS
+        payload_distribution: Distribution of /predict payloads
+        with_training: Start a training job first and tag requests served
+            while it is running
+        seed: Seed for the request mix and payloads
+        timeout: Per-request timeout in seconds
+
+    Returns:
+        JSON-serializable report
+    """
+    mix = mix or DEFAULT_MIX
+    unknown = set(mix) - set(ENDPOINTS)
+    if unknown:
+        raise ValueError(f"Unknown endpoints in mix: {sorted(unknown)}")
+    if payload_distribution not in PAYLOAD_DISTRIBUTIONS:
+        raise ValueError(f"Unknown payload distribution: {payload_distribution}")
+    if base_url is None and app is None:
+        raise ValueError("Either base_url or app is required")
+
+    if base_url is None:
+        with serve_in_thread(app) as local_url:
+            report = await run_load_test(
+                base_url=local_url,
+                concurrency=concurrency,
+                total_requests=total_requests,
+                duration=duration,
+                mix=mix,
+                payload_distribution=payload_distribution,
+                with_training=with_training,
+                seed=seed,
+                timeout=timeout
+            )
+        report["config"]["target"] = "in-process"
+        return report
+
+    client = httpx.AsyncClient(base_url=base_url, timeout=timeout)
+
+    rng = random.Random(seed)
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    samples: List[_Sample] = []
+    issued = 0
+    training = {"active": False, "start_response": None, "final_status": None}
+    transitions: List[Tuple[float, bool]] = []  # (time, training active) at each change
+    stop = asyncio.Event()
+
+    def set_training_active(active: bool):
+        if not transitions or active != training["active"]:
+            transitions.append((time.perf_counter(), active))
+        training["active"] = active
+
+    async def poll_training():
+        # Poller requests are not counted in the report
+        while not stop.is_set():
+            try:
+                response = await client.get("/training-status")
+                set_training_active(response.json().get("status") == "training")
+            except (httpx.HTTPError, ValueError):
+                pass
+            try:
+                await asyncio.wait_for(stop.wait(), TRAINING_POLL_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+
+    async def user(deadline: Optional[float]):
+        nonlocal issued
+        while True:
+            if deadline is not None:
+                if time.perf_counter() >= deadline:
+                    return
+            elif issued >= total_requests:
+                return
+            issued += 1
+
+            name = rng.choices(names, weights)[0]
+            method, path = ENDPOINTS[name]
+            body = random_patient(rng, payload_distribution) if method == "POST" else None
+            training_active = training["active"]
+
+            start = time.perf_counter()
+            try:
+                response = await client.request(method, path, json=body)
+                ok = response.status_code < 400
+            except httpx.HTTPError:
+                ok = False
+            samples.append(_Sample(name, time.perf_counter() - start, ok, training_active))
+
+    async with client:
+        poller = None
+        if with_training:
+            response = await client.post("/start-training", json={})
+            training["start_response"] = response.status_code
+            set_training_active(response.status_code < 400)
+            poller = asyncio.create_task(poll_training())
+
+        started = time.perf_counter()
+        deadline = started + duration if duration is not None else None
+        await asyncio.gather(*(user(deadline) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+        stop.set()
+        if poller is not None:
+            await poller
+            training["final_status"] = (await client.get("/training-status")).json().get("status")
+
+    report = {
+        "config": {
+            "target": base_url,
+            "concurrency": concurrency,
+            "total_requests": total_requests if duration is None else None,
+            "duration": duration,
+            "mix": mix,
+            "payload_distribution": payload_distribution,
+            "with_training": with_training,
+            "seed": seed,
+        },
+        "elapsed_s": elapsed,
+        **_summarize_samples(samples, elapsed),
+        "endpoints": {
+            name: _summarize_samples([s for s in samples if s.endpoint == name], elapsed)
+            for name in names
+        },
+    }
+
+    if with_training:
+        # Throughput in each state is over the time spent in that state, as
+        # seen by the poller (so accurate to about TRAINING_POLL_INTERVAL)
+        training_s = _seconds_in_state(transitions, started, started + elapsed)
+        idle_s = max(0.0, elapsed - training_s)
+        report["training"] = {
+            "start_status_code": training["start_response"],
+            "final_status": training["final_status"],
+            "training_s": training_s,
+            "idle_s": idle_s,
+            # Compare these to see how much training slows serving
+            "during_training": _summarize_samples(
+                [s for s in samples if s.training_active], training_s
+            ),
+            "idle": _summarize_samples(
+                [s for s in samples if not s.training_active], idle_s
+            ),
+        }
+
+    return report
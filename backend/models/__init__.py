@@ -1,5 +1,33 @@
 """Models package."""
 
-from .heart_model import HeartDiseaseModel, get_parameters, set_parameters
+from .heart_model import HeartDiseaseModel, get_parameters, set_parameters, model_fingerprint
+from .precision import (
+    training_autocast,
+    quantize_model,
+    build_serving_model,
+    check_precision_parity
+)
+from .registry import (
+    save_model_version,
+    load_model_version,
+    load_latest_model_version,
+    clear_latest_model_version
+)
+from .personalized import PersonalizedModelStore, personalized_store
 
-__all__ = ['HeartDiseaseModel', 'get_parameters', 'set_parameters']
+__all__ = [
+    'HeartDiseaseModel',
+    'get_parameters',
+    'set_parameters',
+    'model_fingerprint',
+    'training_autocast',
+    'quantize_model',
+    'build_serving_model',
+    'check_precision_parity',
+    'save_model_version',
+    'load_model_version',
+    'load_latest_model_version',
+    'clear_latest_model_version',
+    'PersonalizedModelStore',
+    'personalized_store'
+]
@@ -1,8 +1,8 @@
 """Neural network model for cardiovascular risk prediction."""
 
+import hashlib
 import torch
 import torch.nn as nn
-import torch.nn.functional as F
 from config import NUM_FEATURES, HIDDEN_LAYERS, DROPOUT_RATE
 
 
@@ -14,30 +14,40 @@ class HeartDiseaseModel(nn.Module):
         
         # Input layer
         self.fc1 = nn.Linear(NUM_FEATURES, HIDDEN_LAYERS[0])
+        self.relu1 = nn.ReLU()
         self.dropout1 = nn.Dropout(DROPOUT_RATE)
         
         # Hidden layers
         self.fc2 = nn.Linear(HIDDEN_LAYERS[0], HIDDEN_LAYERS[1])
+        self.relu2 = nn.ReLU()
         self.dropout2 = nn.Dropout(DROPOUT_RATE)
         
         self.fc3 = nn.Linear(HIDDEN_LAYERS[1], HIDDEN_LAYERS[2])
+        self.relu3 = nn.ReLU()
         self.dropout3 = nn.Dropout(DROPOUT_RATE)
         
         # Output layer
         self.fc4 = nn.Linear(HIDDEN_LAYERS[2], 1)
+        # Activations are modules (not functional calls) so that
+        # shap.DeepExplainer can hook them
+        self.sigmoid = nn.Sigmoid()
     
     def forward(self, x):
         """Forward pass through the network."""
-        x = F.relu(self.fc1(x))
+        x = self.features(x)
+        x = self.sigmoid(self.fc4(x))
+        return x
+    
+    def features(self, x):
+        """Shared body: hidden representation fed to the output head (fc4)."""
+        x = self.relu1(self.fc1(x))
         x = self.dropout1(x)
         
-        x = F.relu(self.fc2(x))
+        x = self.relu2(self.fc2(x))
         x = self.dropout2(x)
         
-        x = F.relu(self.fc3(x))
+        x = self.relu3(self.fc3(x))
         x = self.dropout3(x)
-        
-        x = torch.sigmoid(self.fc4(x))
         return x
 
 
@@ -52,3 +62,11 @@ def set_parameters(model, parameters):
     state_dict = {k: torch.tensor(v) for k, v in params_dict}
     model.load_state_dict(state_dict, strict=True)
 
+
+
+def model_fingerprint(parameters):
+    """Return a short content hash identifying a set of model parameters."""
+    digest = hashlib.sha1()
+    for array in parameters:
+        digest.update(array.tobytes())
+    return digest.hexdigest()[:12]
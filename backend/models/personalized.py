@@ -0,0 +1,111 @@
+"""Per-hospital personalized output heads stored as deltas over the global model."""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import numpy as np
+import torch
+
+from config import ARTIFACTS_DIR, PERSONALIZED_CACHE_SIZE
+
+
+class PersonalizedModelStore:
+    """
+    Stores and serves per-hospital head deltas.
+
+    The global model (shared body and head) is held once by the explainer;
+    for each hospital only the difference between its fine-tuned output
+    head and the global head is persisted. Deltas are loaded lazily on
+    first use and kept in an LRU cache of ``cache_size`` hospitals.
+    """
+
+    def __init__(
+        self,
+        directory: str = os.path.join(ARTIFACTS_DIR, "personalized"),
+        cache_size: int = PERSONALIZED_CACHE_SIZE
+    ):
+        """Initialize the store."""
+        self.directory = directory
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _path(self, model_version: str, hospital_id: int) -> str:
+        return os.path.join(self.directory, model_version, f"hospital_{hospital_id}.npz")
+
+    def save_delta(self, model_version: str, hospital_id: int, weight_delta: np.ndarray, bias_delta: np.ndarray):
+        """
+        Persist the head delta of one hospital for a model version.
+
+        Args:
+            model_version: Version of the global model the delta applies to
+            hospital_id: Hospital identifier
+            weight_delta, bias_delta: Fine-tuned head minus global head
+        """
+        path = self._path(model_version, hospital_id)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path[:-len('.npz')]}.tmp.npz"
+        np.savez(tmp_path, weight=weight_delta, bias=bias_delta)
+        os.replace(tmp_path, path)
+
+        # Drop a stale cached copy, if any
+        with self._lock:
+            self._cache.pop((model_version, hospital_id), None)
+
+    def has_delta(self, model_version: str, hospital_id: int) -> bool:
+        """Return True if a hospital has a personalized head for a model version."""
+        with self._lock:
+            if (model_version, hospital_id) in self._cache:
+                return True
+        return os.path.exists(self._path(model_version, hospital_id))
+
+    def _load_delta(self, model_version: str, hospital_id: int) -> Optional[Tuple[torch.Tensor, torch.Tensor]]:
+        key = (model_version, hospital_id)
+        with self._lock:
+            delta = self._cache.get(key)
+            if delta is not None:
+                self._cache.move_to_end(key)
+                return delta
+
+        path = self._path(model_version, hospital_id)
+        if not os.path.exists(path):
+            return None
+        with np.load(path) as data:
+            delta = (torch.from_numpy(data["weight"]), torch.from_numpy(data["bias"]))
+
+        with self._lock:
+            self._cache[key] = delta
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return delta
+
+    def get_head(
+        self,
+        model_version: str,
+        hospital_id: int,
+        base_weight: torch.Tensor,
+        base_bias: torch.Tensor
+    ) -> Optional[Tuple[torch.Tensor, torch.Tensor]]:
+        """
+        Return a hospital's personalized head for a model version.
+
+        Args:
+            model_version: Version of the served global model
+            hospital_id: Hospital identifier
+            base_weight, base_bias: Output head of the shared global model
+
+        Returns:
+            (weight, bias) of the personalized head, or None if the
+            hospital has no personalization for this version
+        """
+        delta = self._load_delta(model_version, hospital_id)
+        if delta is None:
+            return None
+        return base_weight + delta[0], base_bias + delta[1]
+
+
+# Global store instance
+personalized_store = PersonalizedModelStore()
@@ -0,0 +1,92 @@
+"""Reduced-precision training and quantized inference helpers."""
+
+import contextlib
+import copy
+from typing import Callable, Dict
+
+import numpy as np
+import torch
+import torch.nn as nn
+
+PRECISIONS = ("fp32", "bf16", "int8")
+
+
+def training_autocast(precision: str):
+    """
+    Return the autocast context used for local training.
+
+    Args:
+        precision: "fp32" or "bf16"
+
+    Returns:
+        Context manager wrapping the forward pass
+    """
+    if precision == "bf16":
+        return torch.autocast(device_type="cpu", dtype=torch.bfloat16)
+    if precision == "fp32":
+        return contextlib.nullcontext()
+    raise ValueError(f"Unsupported training precision: {precision}")
+
+
+def quantize_model(model: nn.Module) -> nn.Module:
+    """
+    Build an int8 dynamically quantized copy of a model for CPU serving.
+
+    Linear weights are stored as int8 and activations are quantized on
+    the fly, so the original fp32 model is left untouched (it is still
+    needed for attributions).
+    """
+    model_copy = copy.deepcopy(model)
+    model_copy.eval()
+    return torch.ao.quantization.quantize_dynamic(
+        model_copy, {nn.Linear}, dtype=torch.qint8
+    )
+
+
+def build_serving_model(model: nn.Module, precision: str) -> nn.Module:
+    """Return the model variant used to serve predictions at a given precision."""
+    if precision == "int8":
+        return quantize_model(model)
+    if precision == "fp32":
+        return model
+    raise ValueError(f"Unsupported serving precision: {precision}")
+
+
+def check_precision_parity(
+    reference_fn: Callable[[torch.Tensor], torch.Tensor],
+    candidate_fn: Callable[[torch.Tensor], torch.Tensor],
+    X: np.ndarray,
+    y: np.ndarray,
+    tolerance: float
+) -> Dict:
+    """
+    Compare a reduced-precision prediction path against the fp32 reference.
+
+    Args:
+        reference_fn: fp32 prediction function returning probabilities
+        candidate_fn: Reduced-precision prediction function
+        X, y: Evaluation data
+        tolerance: Maximum allowed accuracy drop
+
+    Returns:
+        Dictionary with both accuracies, the largest probability difference
+        and whether the candidate passed
+    """
+    inputs = torch.as_tensor(np.asarray(X, dtype=np.float32))
+    labels = np.asarray(y).reshape(-1)
+
+    with torch.no_grad():
+        reference = reference_fn(inputs).float().numpy().reshape(-1)
+        candidate = candidate_fn(inputs).float().numpy().reshape(-1)
+
+    reference_accuracy = float(((reference >= 0.5) == labels).mean())
+    candidate_accuracy = float(((candidate >= 0.5) == labels).mean())
+    accuracy_drop = reference_accuracy - candidate_accuracy
+
+    return {
+        "reference_accuracy": reference_accuracy,
+        "candidate_accuracy": candidate_accuracy,
+        "accuracy_drop": accuracy_drop,
+        "max_probability_diff": float(np.abs(reference - candidate).max()),
+        "passed": accuracy_drop <= tolerance
+    }
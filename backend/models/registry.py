@@ -0,0 +1,86 @@
+"""On-disk registry of published global model versions."""
+
+import json
+import os
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from config import ARTIFACTS_DIR
+
+MODELS_DIR = os.path.join(ARTIFACTS_DIR, "models")
+LATEST_PATH = os.path.join(MODELS_DIR, "LATEST")
+
+
+def save_model_version(version: str, parameters: List[np.ndarray], info: Dict) -> str:
+    """
+    Persist the parameters and metadata of a model version and mark it as latest.
+
+    Args:
+        version: Model version identifier
+        parameters: Model parameters as numpy arrays
+        info: JSON-serializable metadata (precision, parity checks, ...)
+
+    Returns:
+        Path to the metadata file
+    """
+    os.makedirs(MODELS_DIR, exist_ok=True)
+    params_path = os.path.join(MODELS_DIR, f"{version}.npz")
+    info_path = os.path.join(MODELS_DIR, f"{version}.json")
+
+    # Write to temporary files first so a crash never leaves a torn version
+    tmp_params_path = os.path.join(MODELS_DIR, f"{version}.tmp.npz")
+    np.savez(tmp_params_path, *parameters)
+    os.replace(tmp_params_path, params_path)
+
+    tmp_info_path = f"{info_path}.tmp"
+    with open(tmp_info_path, "w") as f:
+        json.dump(info, f, indent=2)
+    os.replace(tmp_info_path, info_path)
+
+    # The pointer moves last, so it always names a complete version
+    tmp_latest_path = f"{LATEST_PATH}.tmp"
+    with open(tmp_latest_path, "w") as f:
+        f.write(version)
+    os.replace(tmp_latest_path, LATEST_PATH)
+
+    return info_path
+
+
+def load_model_version(version: str) -> Optional[Tuple[List[np.ndarray], Dict]]:
+    """
+    Load the parameters and metadata of a model version.
+
+    Returns:
+        parameters, info: Or None if the version does not exist
+    """
+    params_path = os.path.join(MODELS_DIR, f"{version}.npz")
+    info_path = os.path.join(MODELS_DIR, f"{version}.json")
+    if not (os.path.exists(params_path) and os.path.exists(info_path)):
+        return None
+
+    with np.load(params_path) as data:
+        parameters = [data[f"arr_{i}"] for i in range(len(data.files))]
+    with open(info_path) as f:
+        info = json.load(f)
+    return parameters, info
+
+
+def load_latest_model_version() -> Optional[Tuple[List[np.ndarray], Dict]]:
+    """
+    Load the most recently published model version.
+
+    Returns:
+        parameters, info: Or None if nothing was published (or it was cleared)
+    """
+    if not os.path.exists(LATEST_PATH):
+        return None
+    with open(LATEST_PATH) as f:
+        version = f.read().strip()
+    return load_model_version(version)
+
+
+def clear_latest_model_version():
+    """Forget the latest pointer; saved versions stay on disk."""
+    if os.path.exists(LATEST_PATH):
+        os.remove(LATEST_PATH)
@@ -5,4 +5,8 @@ router = APIRouter()
 
 @router.get("/clients")
 async def get_clients():
-    return hospital_controller.get_clients()
\ No newline at end of file
+    return hospital_controller.get_clients()
+
+@router.post("/api/hospital/{hospital_id}/predict")
+async def predict(hospital_id: int, features: dict):
+    return hospital_controller.predict(hospital_id, features)
\ No newline at end of file
@@ -1,4 +1,5 @@
-from fastapi import APIRouter
+from typing import Dict, List
+from fastapi import APIRouter, Body
 from controllers.prediction_controller import prediction_controller
 
 router = APIRouter()
@@ -7,6 +8,14 @@ router = APIRouter()
 async def predict(features: dict):
     return prediction_controller.predict(features)
 
+@router.post("/predict/batch")
+async def predict_batch(records: List[Dict[str, float]] = Body(...)):
+    return prediction_controller.predict_batch(records)
+
+@router.get("/explain/global")
+async def explain_global():
+    return prediction_controller.explain_global()
+
 @router.get("/features")
 async def get_features():
     return prediction_controller.get_features()
\ No newline at end of file
@@ -1,10 +1,41 @@
+from fastapi import HTTPException
+
+from data.encoder import InvalidFeaturesError
+from explainability.shap_explainer import explainer
+from models.personalized import personalized_store
 from training.manager import training_manager
+from config import NUM_CLIENTS
 
 class HospitalService:
     def __init__(self):
         self.manager = training_manager
+        self.explainer = explainer
+        self.store = personalized_store
     
     def get_clients(self):
         return self.manager.get_clients()
+    
+    def predict(self, hospital_id: int, features: dict):
+        if not 1 <= hospital_id <= NUM_CLIENTS:
+            raise HTTPException(status_code=404, detail=f"Unknown hospital: {hospital_id}")
+        
+        # Shared global body and head, plus this hospital's small head delta
+        head = None
+        model = self.explainer.model
+        version = self.manager.model_version
+        if model is not None and version is not None:
+            head = self.store.get_head(
+                version, hospital_id, model.fc4.weight.detach(), model.fc4.bias.detach()
+            )
+        
+        try:
+            result = self.explainer.explain_prediction(
+                features, head=head, head_key=(version, hospital_id)
+            )
+        except InvalidFeaturesError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        result["hospital_id"] = hospital_id
+        result["personalized"] = head is not None
+        return result
 
 hospital_service = HospitalService()
\ No newline at end of file
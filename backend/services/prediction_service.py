@@ -1,4 +1,8 @@
+from fastapi import HTTPException
+
+from data.encoder import InvalidFeaturesError
 from explainability.shap_explainer import explainer
+from explainability.global_importance import global_importance
 from training.manager import training_manager
 
 class PredictionService:
@@ -7,9 +11,33 @@ class PredictionService:
         self.manager = training_manager
     
     def predict(self, features: dict):
-        return self.explainer.explain_prediction(features)
+        try:
+            return self.explainer.explain_prediction(features)
+        except InvalidFeaturesError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    
+    def predict_batch(self, records: list):
+        try:
+            return self.explainer.explain_batch(records)
+        except InvalidFeaturesError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    
+    def explain_global(self):
+        version = self.manager.model_version
+        if version is None:
+            return {"status": "unavailable", "detail": "No trained model - train first"}
+        
+        artifact = global_importance.get(version)
+        if artifact is not None:
+            return {"status": "ready", **artifact}
+        
+        return {
+            "status": global_importance.status(version),
+            "model_version": version,
+            "detail": global_importance.error(version)
+        }
     
     def get_features(self):
-        return self.manager.get_feature_names()
+        return self.explainer.encoder.describe()
 
 prediction_service = PredictionService()
\ No newline at end of file
@@ -1,3 +1,5 @@
+from fastapi import HTTPException
+
 from training.manager import training_manager
 
 class SystemService:
@@ -5,6 +7,9 @@ class SystemService:
         self.manager = training_manager
     
     def reset_system(self):
-        return self.manager.reset()
+        try:
+            return self.manager.reset()
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
 
 system_service = SystemService()
\ No newline at end of file
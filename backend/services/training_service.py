@@ -1,3 +1,5 @@
+from fastapi import HTTPException
+
 from training.manager import training_manager
 
 class TrainingService:
@@ -5,7 +7,11 @@ class TrainingService:
         self.manager = training_manager
     
     def start_training(self, config: dict):
-        return self.manager.start_training(config)
+        try:
+            return self.manager.start_training(config)
+        except ValueError as e:
+            # start_training only validates options before handing off to its thread
+            raise HTTPException(status_code=400, detail=str(e))
     
     def get_training_status(self):
         return self.manager.get_status()
@@ -0,0 +1,10 @@
+import os
+import sys
+import tempfile
+
+# Tests import backend modules the same way main.py does
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Keep tests off backend/artifacts: the training manager restores the latest
+# registered model at import, so router tests would depend on local state
+os.environ["ARTIFACTS_DIR"] = tempfile.mkdtemp(prefix="heart-fl-artifacts-")
@@ -0,0 +1,102 @@
+"""Aggregation rules of the AggregationEngine against plain numpy."""
+
+import numpy as np
+import pytest
+
+from federated.aggregation import AggregationEngine
+
+SHAPES = [(4, 3), (4,), (1, 4), (1,)]
+
+
+def _updates(num_clients, seed=0):
+    rng = np.random.default_rng(seed)
+    return [
+        [rng.normal(size=shape).astype(np.float32) for shape in SHAPES]
+        for _ in range(num_clients)
+    ]
+
+
+def _flat(parameters):
+    return np.concatenate([array.ravel() for array in parameters])
+
+
+def _check(result, expected_flat):
+    assert [array.shape for array in result] == SHAPES
+    np.testing.assert_allclose(_flat(result), expected_flat, rtol=1e-5, atol=1e-6)
+
+
+def test_fedavg_is_weighted_mean():
+    updates, sizes = _updates(3), [10, 30, 60]
+    stacked = np.stack([_flat(u) for u in updates])
+
+    result = AggregationEngine("fedavg").aggregate(updates, sizes)
+
+    _check(result, np.average(stacked, axis=0, weights=sizes))
+
+
+def test_median():
+    updates = _updates(5)
+    stacked = np.stack([_flat(u) for u in updates])
+
+    result = AggregationEngine("median").aggregate(updates, [1] * 5)
+
+    _check(result, np.median(stacked, axis=0))
+
+
+def test_trimmed_mean():
+    updates = _updates(10)
+    stacked = np.sort(np.stack([_flat(u) for u in updates]), axis=0)
+
+    result = AggregationEngine("trimmed_mean", trim_ratio=0.2).aggregate(updates, [1] * 10)
+
+    _check(result, stacked[2:8].mean(axis=0))
+
+
+def test_clipped_fedavg_clips_large_updates():
+    reference = _updates(1, seed=1)[0]
+    updates, sizes = _updates(3), [1, 1, 2]
+    reference_flat = _flat(reference)
+    deltas = np.stack([_flat(u) for u in updates]) - reference_flat
+    scales = np.minimum(1.0, 1.0 / np.linalg.norm(deltas, axis=1))
+    weights = np.asarray(sizes, dtype=np.float64) / sum(sizes)
+
+    result = AggregationEngine("clipped_fedavg", clip_norm=1.0).aggregate(updates, sizes, reference=reference)
+
+    _check(result, reference_flat + (weights * scales) @ deltas)
+
+
+def test_clipped_fedavg_without_reference_falls_back_to_mean():
+    updates, sizes = _updates(3), [1, 2, 3]
+    stacked = np.stack([_flat(u) for u in updates])
+
+    result = AggregationEngine("clipped_fedavg", clip_norm=1e-3).aggregate(updates, sizes)
+
+    _check(result, np.average(stacked, axis=0, weights=sizes))
+
+
+@pytest.mark.parametrize("rule", ["fedavg", "median", "trimmed_mean", "clipped_fedavg"])
+def test_buffers_are_reused_across_client_counts_without_mutating_inputs(rule):
+    engine = AggregationEngine(rule, trim_ratio=0.2)
+    reference = _updates(1, seed=2)[0]
+
+    first_updates = _updates(5, seed=3)
+    first_copy = [[array.copy() for array in u] for u in first_updates]
+    first = engine.aggregate(first_updates, [1] * 5, reference=reference)
+    first_flat = _flat(first).copy()
+
+    # A round with fewer clients reuses the buffers sized for five
+    second_updates = _updates(3, seed=4)
+    second = engine.aggregate(second_updates, [1] * 3, reference=reference)
+    expected = AggregationEngine(rule, trim_ratio=0.2).aggregate(second_updates, [1] * 3, reference=reference)
+
+    np.testing.assert_allclose(_flat(second), _flat(expected), rtol=1e-6)
+    # Earlier results and client inputs are untouched
+    np.testing.assert_array_equal(_flat(first), first_flat)
+    for update, original in zip(first_updates, first_copy):
+        for array, original_array in zip(update, original):
+            np.testing.assert_array_equal(array, original_array)
+
+
+def test_unknown_rule_is_rejected():
+    with pytest.raises(ValueError):
+        AggregationEngine("mode")
@@ -0,0 +1,73 @@
+"""Agreement of the native DeepLIFT engine with shap.DeepExplainer."""
+
+import numpy as np
+import pytest
+import torch
+
+from models.heart_model import HeartDiseaseModel
+from data.dataset import generate_heart_disease_data
+from explainability.attribution import DeepLiftAttributor, ShapDeepAttributor
+
+
+def _trained_model():
+    torch.manual_seed(0)
+    model = HeartDiseaseModel()
+    X, _, y, _ = generate_heart_disease_data(num_samples=400, client_id=0, seed=0)
+    X, y = torch.FloatTensor(X), torch.FloatTensor(y).reshape(-1, 1)
+
+    optimizer = torch.optim.Adam(model.parameters(), lr=0.01)
+    criterion = torch.nn.BCELoss()
+    model.train()
+    for _ in range(50):
+        optimizer.zero_grad()
+        criterion(model(X), y).backward()
+        optimizer.step()
+    model.eval()
+    return model
+
+
+@pytest.fixture(scope="module")
+def model():
+    return _trained_model()
+
+
+@pytest.fixture(scope="module")
+def data():
+    background, inputs, _, _ = generate_heart_disease_data(num_samples=150, client_id=1, seed=1)
+    return background[:100], inputs[:20]
+
+
+def test_native_attributions_are_complete(model, data):
+    background, inputs = data
+    attributor = DeepLiftAttributor(model, background)
+
+    attributions = attributor.attribute(inputs)
+
+    with torch.no_grad():
+        predictions = model(torch.FloatTensor(inputs)).numpy().ravel()
+    np.testing.assert_allclose(
+        attributions.sum(axis=1), predictions - attributor.expected_value, atol=1e-4
+    )
+
+
+def test_native_matches_deep_explainer(model, data):
+    pytest.importorskip("shap")
+    background, inputs = data
+
+    native = DeepLiftAttributor(model, background)
+    reference = ShapDeepAttributor(model, torch.FloatTensor(background))
+
+    assert native.expected_value == pytest.approx(reference.expected_value, abs=1e-5)
+    np.testing.assert_allclose(native.attribute(inputs), reference.attribute(inputs), atol=1e-4)
+
+
+def test_personalized_head_matches_deep_explainer(model, data):
+    pytest.importorskip("shap")
+    background, inputs = data
+    weight = model.fc4.weight.detach() * 1.5
+    bias = model.fc4.bias.detach() - 0.2
+
+    native = DeepLiftAttributor(model, background).with_output_layer(weight, bias)
+    reference = ShapDeepAttributor(model, torch.FloatTensor(background)).with_output_layer(weight, bias)
+
+    np.testing.assert_allclose(native.attribute(inputs), reference.attribute(inputs), atol=1e-4)
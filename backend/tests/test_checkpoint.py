@@ -0,0 +1,99 @@
+"""Crash recovery: per-round checkpoints and resuming from them."""
+
+import os
+
+import numpy as np
+import pytest
+
+from federated.server import get_federated_strategy
+from training.checkpoint import CheckpointStore
+from config import CHECKPOINTS_TO_KEEP
+
+NUM_ROUNDS = 4
+
+
+def _parameters(seed):
+    rng = np.random.default_rng(seed)
+    return [rng.normal(size=(3, 2)).astype(np.float32), rng.normal(size=2).astype(np.float32)]
+
+
+def _round_files(store):
+    return sorted(name for name in os.listdir(store.directory) if name.startswith("round_"))
+
+
+def test_save_load_complete_and_prune(tmp_path):
+    store = CheckpointStore(str(tmp_path / "checkpoints"))
+    assert store.load_latest() is None
+    assert not store.has_resumable_run()
+
+    history = []
+    for server_round in range(1, NUM_ROUNDS + 1):
+        history.append({"round": server_round, "accuracy": 0.5 + server_round / 10, "loss": 1.0})
+        state = {
+            "arrays": {"server_m": np.full(8, server_round, dtype=np.float32)},
+            "scalars": {"strategy": "fedavgm"}
+        }
+        store.save_round(server_round, NUM_ROUNDS, _parameters(server_round), state, history)
+
+        latest = store.load_latest()
+        assert latest["round"] == server_round
+        assert latest["completed"] == (server_round == NUM_ROUNDS)
+        assert store.has_resumable_run() == (server_round < NUM_ROUNDS)
+        for loaded, saved in zip(latest["parameters"], _parameters(server_round)):
+            np.testing.assert_array_equal(loaded, saved)
+        np.testing.assert_array_equal(latest["strategy_state"]["arrays"]["server_m"], state["arrays"]["server_m"])
+        assert latest["strategy_state"]["scalars"] == {"strategy": "fedavgm"}
+        assert latest["history"] == history
+
+        kept = [f"round_{r:04d}.npz" for r in range(max(1, server_round - CHECKPOINTS_TO_KEEP + 1), server_round + 1)]
+        assert _round_files(store) == kept
+
+    store.clear()
+    assert store.load_latest() is None
+
+
+def test_resume_numbers_rounds_and_restores_server_moments(tmp_path):
+    store = CheckpointStore(str(tmp_path / "checkpoints"))
+    initial = _parameters(0)
+    updates = [(_parameters(10), 10), (_parameters(11), 30)]
+
+    # Interrupted run: two rounds with FedAdam, then a crash
+    first = get_federated_strategy(num_rounds=NUM_ROUNDS, checkpoint_store=store, strategy_name="fedadam")
+    first.latest_parameters = initial
+    for server_round in (1, 2):
+        parameters = first.aggregate_updates(server_round, updates)
+        first.complete_round(server_round, 0.5, {"accuracy": 0.8}, parameters)
+
+    checkpoint = store.load_latest()
+    assert checkpoint["round"] == 2 and not checkpoint["completed"]
+
+    resumed = get_federated_strategy(
+        num_rounds=checkpoint["num_rounds"],
+        round_offset=checkpoint["round"],
+        history=checkpoint["history"],
+        checkpoint_store=store,
+        strategy_name=checkpoint["strategy_state"]["scalars"]["strategy"]
+    )
+    resumed.latest_parameters = checkpoint["parameters"]
+    resumed.set_state(checkpoint["strategy_state"])
+
+    np.testing.assert_array_equal(resumed.server_optimizer.m, first.server_optimizer.m)
+    np.testing.assert_array_equal(resumed.server_optimizer.v, first.server_optimizer.v)
+
+    # The resumed round continues exactly where the interrupted run would have
+    expected = first.aggregate_updates(3, updates)
+    parameters = resumed.aggregate_updates(1, updates)
+    for array, expected_array in zip(parameters, expected):
+        np.testing.assert_allclose(array, expected_array, rtol=1e-6)
+
+    # Flower restarts at round 1; history and checkpoints use global rounds
+    resumed.complete_round(1, 0.4, {"accuracy": 0.85}, parameters)
+    assert [record["round"] for record in resumed.round_history] == [1, 2, 3]
+    assert store.load_latest()["round"] == 3
+
+
+def test_resume_rejects_a_different_strategy():
+    strategy = get_federated_strategy(strategy_name="fedyogi")
+
+    with pytest.raises(ValueError):
+        strategy.set_state({"arrays": {}, "scalars": {"strategy": "fedavgm"}})
@@ -0,0 +1,42 @@
+"""Input validation and normalization of the FeatureEncoder."""
+
+import numpy as np
+import pytest
+
+from data.encoder import FeatureEncoder, InvalidFeaturesError
+from config import FEATURE_NAMES
+
+PATIENT = dict(zip(FEATURE_NAMES, [58.0, 1.0, 2.0, 140.0, 250.0, 0.0, 1.0, 150.0, 0.0, 1.5, 1.0, 0.0, 2.0]))
+
+
+@pytest.fixture
+def encoder():
+    return FeatureEncoder(normalization={"mean": [1.0] * 13, "std": [2.0] * 13})
+
+
+@pytest.mark.parametrize("value", ["63", True, None, [63]])
+def test_non_numbers_are_rejected(encoder, value):
+    with pytest.raises(InvalidFeaturesError, match="must be numbers"):
+        encoder.to_array({**PATIENT, "age": value})
+
+
+def test_numpy_scalars_and_ints_are_accepted(encoder):
+    raw = encoder.to_array({**PATIENT, "age": np.int64(63), "oldpeak": np.float32(2.3)})
+
+    assert raw.dtype == np.float32 and raw.shape == (1, 13)
+    assert raw[0, 0] == 63.0
+
+
+def test_nan_is_rejected(encoder):
+    with pytest.raises(InvalidFeaturesError, match="finite"):
+        encoder.to_array({**PATIENT, "age": float("nan")})
+
+
+def test_normalize_leaves_raw_unchanged(encoder):
+    raw = encoder.to_batch_array([PATIENT, list(PATIENT.values())])
+    original = raw.copy()
+
+    encoded = encoder.normalize(raw)
+
+    np.testing.assert_array_equal(raw, original)
+    np.testing.assert_allclose(encoded, (original - 1.0) / 2.0)
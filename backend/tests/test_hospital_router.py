@@ -0,0 +1,22 @@
+"""Request handling of the hospital routes."""
+
+from fastapi.testclient import TestClient
+
+from main import app
+from config import NUM_CLIENTS
+from tests.test_prediction_router import PATIENT
+
+client = TestClient(app)
+
+
+def test_predict_unknown_hospital_returns_404():
+    response = client.post(f"/api/hospital/{NUM_CLIENTS + 1}/predict", json=PATIENT)
+
+    assert response.status_code == 404
+
+
+def test_predict_known_hospital():
+    response = client.post("/api/hospital/1/predict", json=PATIENT)
+
+    assert response.status_code == 200
+    assert response.json()["hospital_id"] == 1
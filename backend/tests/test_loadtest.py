@@ -0,0 +1,24 @@
+"""Load test report: per-state throughput uses the time spent in each state."""
+
+import pytest
+
+pytest.importorskip("httpx")
+pytest.importorskip("uvicorn")
+
+from loadtest.runner import _Sample, _seconds_in_state, _summarize_samples
+
+
+def test_seconds_in_state_is_clipped_to_the_window():
+    # Training from t=0 (before the window) to t=4, idle, then again from t=7
+    transitions = [(0.0, True), (4.0, False), (7.0, True)]
+
+    assert _seconds_in_state(transitions, 1.0, 10.0) == pytest.approx(3.0 + 3.0)
+    assert _seconds_in_state(transitions, 5.0, 6.0) == 0.0
+    assert _seconds_in_state([], 0.0, 10.0) == 0.0
+
+
+def test_throughput_divides_by_the_given_duration():
+    samples = [_Sample("predict", 0.01, True, True) for _ in range(30)]
+
+    assert _summarize_samples(samples, 3.0)["throughput_rps"] == pytest.approx(10.0)
+    assert _summarize_samples(samples, 0.0)["throughput_rps"] == 0.0
@@ -0,0 +1,37 @@
+"""Pipelined round scheduling."""
+
+import numpy as np
+
+from models.heart_model import HeartDiseaseModel
+from data.dataset import generate_heart_disease_data
+from federated.client import HeartDiseaseClient
+from federated.pipeline import PipelinedRoundScheduler
+from federated.server import get_federated_strategy
+
+
+def _clients(num_clients=3):
+    clients = {}
+    for client_id in range(num_clients):
+        X_train, X_test, y_train, y_test = generate_heart_disease_data(num_samples=100, client_id=client_id)
+        clients[str(client_id)] = HeartDiseaseClient(HeartDiseaseModel(), X_train, y_train, X_test, y_test)
+    return clients
+
+
+def test_fresh_run_references_initial_weights():
+    clients = _clients()
+    initial = [array.copy() for array in clients["0"].get_parameters({})]
+    strategy = get_federated_strategy(num_rounds=2)
+
+    references = []
+    aggregate_updates = strategy.aggregate_updates
+
+    def recording_aggregate(server_round, updates):
+        references.append([array.copy() for array in strategy.latest_parameters])
+        return aggregate_updates(server_round, updates)
+
+    strategy.aggregate_updates = recording_aggregate
+    PipelinedRoundScheduler(clients, strategy, fit_workers=3, eval_workers=2).run(2)
+
+    for reference, array in zip(references[0], initial):
+        np.testing.assert_array_equal(reference, array)
+    assert [record["round"] for record in strategy.round_history] == [1, 2]
@@ -0,0 +1,57 @@
+"""Accuracy of reduced-precision training and serving versus fp32."""
+
+import pytest
+import torch
+
+from models.heart_model import HeartDiseaseModel
+from models.precision import build_serving_model, check_precision_parity
+from data.dataset import generate_heart_disease_data
+from federated.client import HeartDiseaseClient
+from config import PRECISION_PARITY_TOLERANCE
+
+LOCAL_ROUNDS = 10
+# Two independent training runs differ by more than one serving pass
+TRAINING_TOLERANCE = 0.05
+
+
+def _train(precision, data):
+    X_train, X_test, y_train, y_test = data
+    torch.manual_seed(0)
+    client = HeartDiseaseClient(
+        HeartDiseaseModel(), X_train, y_train, X_test, y_test, precision=precision
+    )
+    parameters = client.get_parameters({})
+    for _ in range(LOCAL_ROUNDS):
+        parameters, _, _ = client.fit(parameters, {})
+    _, _, metrics = client.evaluate(parameters, {})
+    return client, metrics["accuracy"]
+
+
+@pytest.fixture(scope="module")
+def data():
+    return generate_heart_disease_data(num_samples=600, client_id=1)
+
+
+@pytest.fixture(scope="module")
+def fp32_run(data):
+    return _train("fp32", data)
+
+
+def test_bf16_training_matches_fp32_accuracy(data, fp32_run):
+    _, fp32_accuracy = fp32_run
+    _, bf16_accuracy = _train("bf16", data)
+
+    assert bf16_accuracy >= fp32_accuracy - TRAINING_TOLERANCE
+
+
+def test_int8_serving_passes_parity(data, fp32_run):
+    client, _ = fp32_run
+    _, X_test, _, y_test = data
+    model = client.eval_model
+    model.eval()
+
+    parity = check_precision_parity(
+        model, build_serving_model(model, "int8"), X_test, y_test, PRECISION_PARITY_TOLERANCE
+    )
+
+    assert parity["passed"], parity
@@ -0,0 +1,47 @@
+"""Request handling of the prediction routes."""
+
+from fastapi.testclient import TestClient
+
+from main import app
+from config import FEATURE_NAMES
+
+client = TestClient(app)
+
+PATIENT = {
+    "age": 58.0,
+    "sex": 1.0,
+    "chest_pain_type": 2.0,
+    "resting_bp": 140.0,
+    "cholesterol": 250.0,
+    "fasting_bs": 0.0,
+    "resting_ecg": 1.0,
+    "max_heart_rate": 150.0,
+    "exercise_angina": 0.0,
+    "oldpeak": 1.5,
+    "st_slope": 1.0,
+    "ca": 0.0,
+    "thal": 2.0,
+}
+
+
+def test_patient_covers_all_features():
+    assert set(PATIENT) == set(FEATURE_NAMES)
+
+
+def test_predict_batch_accepts_json_list():
+    response = client.post("/predict/batch", json=[PATIENT, PATIENT])
+
+    assert response.status_code == 200
+    results = response.json()
+    assert len(results) == 2
+    for result in results:
+        assert 0.0 <= result["prediction"] <= 1.0
+        assert {item["feature"] for item in result["feature_importance"]} == set(FEATURE_NAMES)
+
+
+def test_predict_batch_rejects_missing_feature():
+    incomplete = {name: value for name, value in PATIENT.items() if name != "age"}
+
+    response = client.post("/predict/batch", json=[PATIENT, incomplete])
+
+    assert response.status_code == 400
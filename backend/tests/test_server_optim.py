@@ -0,0 +1,72 @@
+"""One-step updates of the server optimizers against their formulas."""
+
+import numpy as np
+import pytest
+
+from federated.server_optim import ServerOptimizer
+
+LR, MOMENTUM, BETA2, TAU = 0.5, 0.9, 0.99, 1e-3
+
+
+def _arrays(seed):
+    rng = np.random.default_rng(seed)
+    return [rng.normal(size=(2, 3)).astype(np.float32), rng.normal(size=3).astype(np.float32)]
+
+
+def _flat(arrays):
+    return np.concatenate([array.ravel() for array in arrays]).astype(np.float64)
+
+
+def _optimizer(name):
+    return ServerOptimizer(name, learning_rate=LR, momentum=MOMENTUM, beta2=BETA2, adaptivity=TAU)
+
+
+def _expected_step(name, x, delta, m, v):
+    if name == "fedavgm":
+        m = MOMENTUM * m + delta
+        return x + LR * m, m, v
+    m = MOMENTUM * m + (1 - MOMENTUM) * delta
+    if name == "fedadam":
+        v = BETA2 * v + (1 - BETA2) * delta ** 2
+    else:
+        v = v - (1 - BETA2) * delta ** 2 * np.sign(v - delta ** 2)
+    return x + LR * m / (np.sqrt(v) + TAU), m, v
+
+
+@pytest.mark.parametrize("name", ["fedavgm", "fedadam", "fedyogi"])
+def test_two_steps_follow_the_formulas(name):
+    optimizer = _optimizer(name)
+    current = _arrays(0)
+    x = _flat(current)
+    m, v = np.zeros_like(x), np.full_like(x, TAU ** 2)
+
+    for seed in (1, 2):
+        aggregated = _arrays(seed)
+        x, m, v = _expected_step(name, x, _flat(aggregated) - x, m, v)
+        current = optimizer.step(current, aggregated)
+
+        assert [array.shape for array in current] == [(2, 3), (3,)]
+        np.testing.assert_allclose(_flat(current), x, rtol=1e-5, atol=1e-6)
+        np.testing.assert_allclose(optimizer.m, m, rtol=1e-5, atol=1e-7)
+
+
+@pytest.mark.parametrize("name", ["fedavgm", "fedadam", "fedyogi"])
+def test_state_round_trip(name):
+    optimizer = _optimizer(name)
+    current = optimizer.step(_arrays(0), _arrays(1))
+    state = optimizer.get_state()
+    saved_m, saved_v = state["server_m"].copy(), state["server_v"].copy()
+
+    restored = _optimizer(name)
+    restored.set_state(state)
+    expected = optimizer.step(current, _arrays(2))
+
+    # State is a copy: further steps must not change what was saved
+    np.testing.assert_array_equal(state["server_m"], saved_m)
+    np.testing.assert_array_equal(state["server_v"], saved_v)
+    np.testing.assert_allclose(_flat(restored.step(current, _arrays(2))), _flat(expected), rtol=1e-6)
+
+
+def test_unknown_optimizer_is_rejected():
+    with pytest.raises(ValueError):
+        ServerOptimizer("fedsgd")
@@ -0,0 +1,30 @@
+"""Client functions shipped to simulation workers."""
+
+import pickle
+
+import pytest
+
+from data.dataset import generate_heart_disease_data
+from federated.client import HeartDiseaseClient
+from federated.client_pool import client_pool
+from federated.simulation import create_client_fn, simulation_client_fn
+
+
+@pytest.fixture
+def normalization():
+    X_train, _, _, _ = generate_heart_disease_data(normalize=False)
+    return {"mean": X_train.mean(axis=0).tolist(), "std": (X_train.std(axis=0) + 1e-7).tolist()}
+
+
+def test_simulation_client_fn_survives_cloudpickle(normalization):
+    cloudpickle = pytest.importorskip("ray.cloudpickle")
+    client_fns = {"0": create_client_fn(0, None, "pickle-test", normalization)}
+
+    payload = cloudpickle.dumps(simulation_client_fn(client_fns))
+
+    # Load as a worker would and build the client from the worker's pool
+    client = pickle.loads(payload)("0")
+    assert isinstance(client, HeartDiseaseClient)
+    assert client_pool.get("pickle-test", "0", lambda: None) is client
+    client_pool.release("pickle-test")
+    assert len(client_pool) == 0
@@ -1,5 +1,6 @@
 """Training package."""
 
 from .manager import TrainingManager, training_manager
+from .checkpoint import CheckpointStore
 
-__all__ = ['TrainingManager', 'training_manager']
+__all__ = ['TrainingManager', 'training_manager', 'CheckpointStore']
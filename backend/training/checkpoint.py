@@ -0,0 +1,142 @@
+"""Durable per-round checkpoints for resuming interrupted federated runs."""
+
+import json
+import os
+import shutil
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from config import ARTIFACTS_DIR, CHECKPOINTS_TO_KEEP
+
+MANIFEST_NAME = "latest.json"
+
+
+def _fsync_replace(tmp_path: str, path: str):
+    """Atomically move a fully written file into place."""
+    os.replace(tmp_path, path)
+    # Persist the rename itself
+    dir_fd = os.open(os.path.dirname(path), os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+class CheckpointStore:
+    """Stores aggregated parameters, strategy state and metrics after every round."""
+
+    def __init__(self, directory: str = os.path.join(ARTIFACTS_DIR, "checkpoints")):
+        """Initialize the store."""
+        self.directory = directory
+
+    def _round_path(self, server_round: int) -> str:
+        return os.path.join(self.directory, f"round_{server_round:04d}.npz")
+
+    def save_round(
+        self,
+        server_round: int,
+        num_rounds: int,
+        parameters: List[np.ndarray],
+        strategy_state: Dict,
+        history: List[Dict]
+    ):
+        """
+        Durably record a completed round.
+
+        The arrays are written first and the manifest last, so the
+        manifest only ever points at a complete checkpoint.
+
+        Args:
+            server_round: Global round number that just completed
+            num_rounds: Total number of rounds planned for the run
+            parameters: Aggregated global parameters
+            strategy_state: Arrays ("arrays") and scalars ("scalars") of the strategy
+            history: Round metrics so far
+        """
+        os.makedirs(self.directory, exist_ok=True)
+
+        arrays = {f"param_{i}": array for i, array in enumerate(parameters)}
+        for name, array in strategy_state.get("arrays", {}).items():
+            arrays[f"state_{name}"] = array
+
+        path = self._round_path(server_round)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(f, **arrays)
+            f.flush()
+            os.fsync(f.fileno())
+        _fsync_replace(tmp_path, path)
+
+        manifest = {
+            "round": server_round,
+            "num_rounds": num_rounds,
+            "num_parameters": len(parameters),
+            "strategy_scalars": strategy_state.get("scalars", {}),
+            "history": history,
+            "completed": server_round >= num_rounds
+        }
+        manifest_path = os.path.join(self.directory, MANIFEST_NAME)
+        tmp_manifest_path = f"{manifest_path}.tmp"
+        with open(tmp_manifest_path, "w") as f:
+            json.dump(manifest, f)
+            f.flush()
+            os.fsync(f.fileno())
+        _fsync_replace(tmp_manifest_path, manifest_path)
+
+        self._prune(server_round)
+
+    def _prune(self, latest_round: int):
+        """Delete round files older than the retention window."""
+        for name in os.listdir(self.directory):
+            if not (name.startswith("round_") and name.endswith(".npz")):
+                continue
+            server_round = int(name[len("round_"):-len(".npz")])
+            if server_round <= latest_round - CHECKPOINTS_TO_KEEP:
+                os.remove(os.path.join(self.directory, name))
+
+    def load_latest(self) -> Optional[Dict]:
+        """
+        Load the most recent complete checkpoint.
+
+        Returns:
+            Dictionary with round, num_rounds, parameters, strategy_state,
+            history and completed; or None if there is no checkpoint
+        """
+        manifest_path = os.path.join(self.directory, MANIFEST_NAME)
+        if not os.path.exists(manifest_path):
+            return None
+
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+
+        with np.load(self._round_path(manifest["round"])) as data:
+            parameters = [data[f"param_{i}"] for i in range(manifest["num_parameters"])]
+            state_arrays = {
+                key[len("state_"):]: data[key]
+                for key in data.files if key.startswith("state_")
+            }
+
+        return {
+            "round": manifest["round"],
+            "num_rounds": manifest["num_rounds"],
+            "parameters": parameters,
+            "strategy_state": {
+                "arrays": state_arrays,
+                "scalars": manifest["strategy_scalars"]
+            },
+            "history": manifest["history"],
+            "completed": manifest["completed"]
+        }
+
+    def has_resumable_run(self) -> bool:
+        """Return True if an interrupted run can be resumed."""
+        manifest_path = os.path.join(self.directory, MANIFEST_NAME)
+        if not os.path.exists(manifest_path):
+            return False
+        with open(manifest_path) as f:
+            return not json.load(f)["completed"]
+
+    def clear(self):
+        """Remove all checkpoints."""
+        shutil.rmtree(self.directory, ignore_errors=True)
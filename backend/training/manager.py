@@ -2,10 +2,48 @@
 
 import asyncio
 import threading
-from typing import Optional, Dict
+from typing import Optional, Dict, List
 from datetime import datetime
 
+import numpy as np
+
 from federated.simulation import run_federated_simulation, extract_training_history
+from federated.server import STRATEGIES
+from models.heart_model import HeartDiseaseModel, set_parameters, model_fingerprint
+from models.precision import training_autocast, build_serving_model, check_precision_parity
+from models.registry import save_model_version, load_latest_model_version, clear_latest_model_version
+from data.dataset import generate_heart_disease_data
+from training.checkpoint import CheckpointStore
+from models.personalized import personalized_store
+from federated.personalization import personalize_hospitals
+from explainability.shap_explainer import explainer
+from explainability.global_importance import global_importance
+from config import (
+    CLIENT_NAMES,
+    NUM_CLIENTS,
+    NUM_ROUNDS,
+    CONTINUAL_ROUNDS,
+    PIPELINED_ROUNDS,
+    FEDERATED_STRATEGY,
+    SAMPLES_PER_CLIENT,
+    TRAINING_PRECISION,
+    SERVING_PRECISION,
+    PRECISION_PARITY_TOLERANCE
+)
+
+
+def _held_out_data(normalization):
+    """Pool every hospital's held-out test split for parity checks."""
+    X_parts, y_parts = [], []
+    for client_id in range(NUM_CLIENTS):
+        _, X_test, _, y_test = generate_heart_disease_data(
+            num_samples=SAMPLES_PER_CLIENT,
+            client_id=client_id,
+            normalization=normalization
+        )
+        X_parts.append(X_test)
+        y_parts.append(y_test)
+    return np.concatenate(X_parts), np.concatenate(y_parts)
 
 
 class TrainingManager:
@@ -22,6 +60,34 @@ class TrainingManager:
         self.end_time = None
         self.training_thread = None
         self.global_model = None  # Will store the trained model
+        self.global_parameters = None  # Parameters of the served global model
+        self.normalization = None  # Feature statistics the served model was trained with
+        self.batches_consumed = 0  # Continual-learning batches already trained on
+        self.model_version = None  # Fingerprint of the served global model
+        self.model_info = None  # Metadata recorded with the served model version
+        self.checkpoints = CheckpointStore()
+        self._restore_latest_model()
+    
+    def _restore_latest_model(self):
+        """Serve the latest published model version again after a restart."""
+        try:
+            latest = load_latest_model_version()
+            if latest is None:
+                return
+            parameters, info = latest
+            
+            model = HeartDiseaseModel()
+            set_parameters(model, parameters)
+            model.eval()
+            self._serve_model(
+                model,
+                build_serving_model(model, info["serving_precision"]),
+                parameters,
+                info
+            )
+        except Exception as e:
+            # Start without a model rather than failing the whole API
+            self.error_message = f"Could not restore the latest model: {e}"
     
     def get_status(self) -> Dict:
         """Get current training status."""
@@ -32,9 +98,27 @@ class TrainingManager:
             "progress": self.current_round / self.total_rounds if self.total_rounds > 0 else 0,
             "start_time": self.start_time.isoformat() if self.start_time else None,
             "end_time": self.end_time.isoformat() if self.end_time else None,
-            "error_message": self.error_message
+            "error_message": self.error_message,
+            "model_version": self.model_version,
+            "model_info": self.model_info,
+            "resumable": self.status != "training" and self.checkpoints.has_resumable_run()
         }
     
+    def get_clients(self) -> List[Dict]:
+        """List the participating hospitals (ids are client id + 1)."""
+        return [
+            {
+                "id": client_id + 1,
+                "name": CLIENT_NAMES[client_id] if client_id < len(CLIENT_NAMES) else f"Hospital {client_id + 1}",
+                "samples": SAMPLES_PER_CLIENT,
+                "personalized": (
+                    self.model_version is not None
+                    and personalized_store.has_delta(self.model_version, client_id + 1)
+                )
+            }
+            for client_id in range(NUM_CLIENTS)
+        ]
+    
     def get_metrics(self) -> Dict:
         """Get training metrics and history."""
         return {
@@ -43,11 +127,47 @@ class TrainingManager:
             "total_rounds": self.total_rounds
         }
     
-    def start_training(self):
-        """Start training in a background thread."""
+    def start_training(self, config: Optional[Dict] = None):
+        """
+        Start training in a background thread.
+        
+        Args:
+            config: Optional options:
+                {"resume": true} continues the last interrupted run from
+                its last completed round;
+                {"mode": "continual", "rounds": n} warm-starts from the
+                served global model and trains only on newly arrived batches;
+                {"pipelined": true} overlaps each round's evaluation with
+                the next round's local fit;
+                {"strategy": "fedadam"} selects the federated strategy
+                (fedavg, fedavgm, fedadam, fedyogi or fedprox; a resumed
+                run keeps the strategy it was started with)
+        """
         if self.status == "training":
             raise ValueError("Training is already in progress")
         
+        config = config or {}
+        options = {
+            "mode": config.get("mode", "full"),
+            "resume": bool(config.get("resume", False)),
+            "rounds": int(config.get("rounds", CONTINUAL_ROUNDS)),
+            "pipelined": bool(config.get("pipelined", PIPELINED_ROUNDS)),
+            "strategy": config.get("strategy", FEDERATED_STRATEGY)
+        }
+        if options["mode"] not in ("full", "continual"):
+            raise ValueError(f"Unknown training mode: {options['mode']}")
+        if options["strategy"] not in STRATEGIES:
+            raise ValueError(f"Unknown federated strategy: {options['strategy']}")
+        if options["mode"] == "continual":
+            if options["resume"]:
+                raise ValueError("Continual rounds cannot be resumed")
+            if self.global_parameters is None:
+                raise ValueError("No global model to continue from - train first")
+            if options["rounds"] < 1:
+                raise ValueError("Continual training needs at least one round")
+        if options["resume"] and not self.checkpoints.has_resumable_run():
+            raise ValueError("No interrupted training run to resume")
+        
         # Reset state
         self.status = "training"
         self.current_round = 0
@@ -57,20 +177,71 @@ class TrainingManager:
         self.end_time = None
         
         # Start training in background thread
-        self.training_thread = threading.Thread(target=self._run_training)
+        self.training_thread = threading.Thread(target=self._run_training, args=(options,))
         self.training_thread.start()
+        
+        return self.get_status()
     
-    def _run_training(self):
+    def _run_training(self, options: Dict):
         """Internal method to run training (executed in background thread)."""
         try:
+            if options["mode"] == "continual":
+                # Short incremental runs are not checkpointed; they must not
+                # overwrite a resumable full run either
+                run_options = {
+                    "num_rounds": options["rounds"],
+                    "initial_parameters": self.global_parameters,
+                    "batch_index": self.batches_consumed,
+                    "normalization": self.normalization,
+                    "checkpoint_store": None
+                }
+            elif options["resume"]:
+                checkpoint = self.checkpoints.load_latest()
+                run_options = {
+                    "num_rounds": checkpoint["num_rounds"],
+                    "initial_parameters": checkpoint["parameters"],
+                    "round_offset": checkpoint["round"],
+                    "completed_history": checkpoint["history"],
+                    "strategy_state": checkpoint["strategy_state"],
+                    "strategy_name": checkpoint["strategy_state"]["scalars"].get("strategy", "fedavg"),
+                    "checkpoint_store": self.checkpoints
+                }
+                self.current_round = checkpoint["round"]
+                self.training_history = extract_training_history(
+                    {"round_history": checkpoint["history"]}
+                )
+            else:
+                # A fresh run must never be resumed into stale rounds
+                self.checkpoints.clear()
+                run_options = {"num_rounds": NUM_ROUNDS, "checkpoint_store": self.checkpoints}
+            
+            run_options.setdefault("strategy_name", options["strategy"])
+            self.total_rounds = run_options["num_rounds"]
+            
             # Run federated simulation
-            simulation_results = run_federated_simulation()
+            # Training shares this process with the API, so keep cores for serving
+            simulation_results = run_federated_simulation(
+                reserve_for_serving=True,
+                on_round_end=self._on_round_end,
+                pipelined=options["pipelined"],
+                **run_options
+            )
             
             # Extract history
             self.training_history = extract_training_history(simulation_results)
             self.total_rounds = simulation_results["rounds"]
             self.current_round = self.total_rounds
             
+            batches_consumed = self.batches_consumed + (1 if options["mode"] == "continual" else 0)
+            if simulation_results.get("parameters") is not None:
+                self._publish_model(
+                    simulation_results["parameters"],
+                    simulation_results["normalization"],
+                    mode=options["mode"],
+                    batches_consumed=batches_consumed
+                )
+            self.batches_consumed = batches_consumed
+            
             # Update status
             self.status = "completed"
             self.end_time = datetime.now()
@@ -80,6 +251,80 @@ class TrainingManager:
             self.error_message = str(e)
             self.end_time = datetime.now()
     
+    def _on_round_end(self, record: Dict):
+        """Expose progress as soon as a round is checkpointed."""
+        self.current_round = record["round"]
+        self.training_history = self.training_history + extract_training_history(
+            {"round_history": [record]}
+        )
+    
+    def _publish_model(self, parameters, normalization: Dict, mode: str = "full", batches_consumed: int = 0):
+        """Serve new global parameters and precompute their global explanation."""
+        model = HeartDiseaseModel()
+        set_parameters(model, parameters)
+        model.eval()
+        
+        X_eval, y_eval = _held_out_data(normalization)
+        parity = {}
+        
+        if TRAINING_PRECISION != "fp32":
+            def reduced_forward(x):
+                with training_autocast(TRAINING_PRECISION):
+                    return model(x)
+            
+            # Only checks this model's predictions under the training autocast;
+            # bf16 versus fp32 training is compared in tests/test_precision.py
+            parity["training_autocast_inference"] = check_precision_parity(
+                model, reduced_forward, X_eval, y_eval, PRECISION_PARITY_TOLERANCE
+            )
+        
+        serving_precision = SERVING_PRECISION
+        serving_model = build_serving_model(model, serving_precision)
+        if serving_precision != "fp32":
+            parity["serving"] = check_precision_parity(
+                model, serving_model, X_eval, y_eval, PRECISION_PARITY_TOLERANCE
+            )
+            # Never serve a variant that is measurably worse than fp32
+            if not parity["serving"]["passed"]:
+                serving_precision = "fp32"
+                serving_model = model
+        
+        version = model_fingerprint(parameters)
+        info = {
+            "version": version,
+            "parent_version": self.model_version if mode == "continual" else None,
+            "training_mode": mode,
+            "created_at": datetime.now().isoformat(),
+            "training_precision": TRAINING_PRECISION,
+            "serving_precision": serving_precision,
+            "parity": parity,
+            "normalization": normalization,
+            # Continual batches trained on so far; the next run starts after them
+            "batches_consumed": batches_consumed
+        }
+        save_model_version(version, parameters, info)
+        self._serve_model(model, serving_model, parameters, info)
+        
+        # Hospital-scoped predictions fall back to the global head until this finishes
+        threading.Thread(
+            target=personalize_hospitals,
+            args=(model, version, normalization, personalized_store),
+            daemon=True
+        ).start()
+    
+    def _serve_model(self, model, serving_model, parameters, info: Dict):
+        """Make a model version the served global model."""
+        self.global_model = model
+        self.global_parameters = parameters
+        self.normalization = info["normalization"]
+        self.batches_consumed = info.get("batches_consumed", 0)
+        self.model_version = info["version"]
+        self.model_info = info
+        explainer.setup(model, serving_model=serving_model, normalization=self.normalization)
+        
+        # Dashboards read this artifact instead of explaining patients one by one
+        global_importance.schedule(self.model_version, explainer.attributor, self.normalization)
+    
     def reset(self):
         """Reset the training manager to initial state."""
         if self.status == "training":
@@ -93,6 +338,14 @@ class TrainingManager:
         self.start_time = None
         self.end_time = None
         self.global_model = None
+        self.global_parameters = None
+        self.normalization = None
+        self.batches_consumed = 0
+        self.model_version = None
+        self.model_info = None
+        self.checkpoints.clear()
+        # Do not bring the model back on the next start
+        clear_latest_model_version()
 
 
 # Global training manager instance